@@ -9,25 +9,117 @@ Usage:
     gh_monitor analyze            # Analyze recent failures in detail
     gh_monitor report             # Generate error report for CI/CD context
     gh_monitor --json output.json # Export to JSON
-    gh_monitor --webhook          # Send notifications to configured webhooks
+    gh_monitor --webhook URL      # Send notifications to a webhook (repeatable)
 """
 
 import argparse
+import hashlib
+import importlib.util
 import json
 import os
+import re
 import sys
-import urllib.request
-import urllib.error
+import threading
+import time
+from collections import Counter
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+
+# requests (and the HTTP/thread-pool stdlib modules) are imported on first
+# use; they dominate start-up time for commands that never touch the network
+HAS_REQUESTS = importlib.util.find_spec("requests") is not None
+
+try:
+    import orjson  # type: ignore
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 try:
-    import requests  # type: ignore
+    from ciso8601 import parse_datetime_as_naive  # type: ignore
 
-    HAS_REQUESTS = True
+    HAS_CISO8601 = True
 except ImportError:
-    HAS_REQUESTS = False
+    HAS_CISO8601 = False
+
+# .env keys that may hold the GitHub token
+TOKEN_KEYS = frozenset({"GITHUB_TOKEN", "GITHUB_API_TOKEN"})
+_TOKEN_RE = re.compile(
+    rf"^[ \t]*(?:{'|'.join(sorted(TOKEN_KEYS))})[ \t]*=(.*)$", re.MULTILINE
+)
+
+# Conditional-request cache: a 304 reply costs no primary rate limit
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "gh_monitor"
+)
+
+# Log lines worth surfacing, matched case-insensitively anywhere in the line
+ERROR_LINE_RE = re.compile(rb"error|failed", re.IGNORECASE)
+
+# Upper bound on concurrent API requests
+FETCH_WORKERS = 8
+
+# Seconds a cached runs listing is reused without asking GitHub at all
+DEFAULT_RUNS_TTL = 30.0
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Jobs (check runs) and their steps for a batch of workflow runs, by node ID
+RUN_JOBS_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on WorkflowRun {
+      databaseId
+      checkSuite {
+        checkRuns(first: 50) {
+          nodes {
+            databaseId
+            name
+            conclusion
+            steps(first: 50) { nodes { name conclusion } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _write_json(filename: str, data: Any):
+    """Write data to a file as indented JSON, using orjson when available"""
+    if HAS_ORJSON:
+        Path(filename).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+def _parse_json(data: bytes) -> Any:
+    """Decode a JSON response body, using orjson when available"""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _decoded(response: Any) -> Any:
+    """Wrap a urllib response so gzip-encoded bodies read as plain bytes"""
+    # requests decompresses on its own; urllib leaves it to the caller
+    if response.headers.get("Content-Encoding") == "gzip":
+        import gzip
+
+        return gzip.GzipFile(fileobj=response)
+    return response
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a GitHub API timestamp (e.g. 2025-08-07T00:52:00Z) as naive UTC"""
+    if HAS_CISO8601:
+        # GitHub timestamps are always UTC, so dropping the offset is safe
+        return parse_datetime_as_naive(value)
+    # fromisoformat is much cheaper than strptime but only accepts "Z" on 3.11+
+    return datetime.fromisoformat(value[:-1] if value.endswith("Z") else value)
 
 
 class GitHubMonitor:
@@ -35,20 +127,32 @@ class GitHubMonitor:
 
     def __init__(self):
         self.token = self._load_token()
+        # Sent with every API request; built once rather than per call
+        self._headers = {
+            "Accept": "application/vnd.github+json",
+            "Accept-Encoding": "gzip",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if self.token:
+            self._headers["Authorization"] = f"token {self.token}"
         self.repo = self._get_repo()
         self.github_context = self._load_github_context()
+        # Derived values reused by every report and webhook payload
+        self._branch = self.github_context["ref"].removeprefix("refs/heads/")
+        self._python_version = sys.version.split(None, 1)[0]
+        self._session = None
+        self._session_lock = threading.Lock()
+        # Parsed JSON responses already fetched by this process, keyed by URL
+        self._responses: Dict[str, Any] = {}
 
     def _load_token(self) -> Optional[str]:
         """Load GitHub token from .env file"""
-        env_path = Path(".env")
-        if env_path.exists():
-            with open(env_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        if key.strip() in ["GITHUB_TOKEN", "GITHUB_API_TOKEN"]:
-                            return value.strip().strip('"').strip("'")
+        try:
+            match = _TOKEN_RE.search(Path(".env").read_text())
+        except OSError:
+            match = None
+        if match:
+            return match.group(1).strip().strip('"').strip("'")
         return os.environ.get("GITHUB_TOKEN")
 
     def _get_repo(self) -> Optional[str]:
@@ -56,113 +160,384 @@ class GitHubMonitor:
         repo = os.environ.get("GITHUB_REPOSITORY", "")
         if not repo:
             try:
-                import subprocess
-
-                url = subprocess.check_output(
-                    ["git", "remote", "get-url", "origin"], text=True
-                ).strip()
+                url = self._read_origin_url() or self._git_origin_url()
                 repo = url.split("github.com")[-1].strip("/:").replace(".git", "")
             except Exception:
                 return None
         return repo
 
+    def _read_origin_url(self) -> Optional[str]:
+        """Read the origin URL straight from .git/config, avoiding a git fork"""
+        import configparser
+
+        config = configparser.ConfigParser(strict=False, interpolation=None)
+        try:
+            if not config.read(Path(".git") / "config"):
+                return None  # Not at a repo root, or a worktree/submodule .git file
+            return config.get('remote "origin"', "url", fallback=None)
+        except (configparser.Error, OSError, UnicodeDecodeError):
+            # Git syntax configparser rejects (e.g. a valueless "bare" key);
+            # returning None lets the caller fall back to asking git
+            return None
+
+    def _git_origin_url(self) -> str:
+        """Ask git for the origin URL"""
+        import subprocess
+
+        return subprocess.check_output(
+            ["git", "remote", "get-url", "origin"], text=True
+        ).strip()
+
     def _load_github_context(self) -> Dict[str, Any]:
         """Load GitHub Actions context from environment"""
+        env = os.environ
         return {
-            "repository": os.environ.get("GITHUB_REPOSITORY", self.repo or ""),
-            "ref": os.environ.get("GITHUB_REF", ""),
-            "sha": os.environ.get("GITHUB_SHA", ""),
-            "actor": os.environ.get("GITHUB_ACTOR", ""),
-            "workflow": os.environ.get("GITHUB_WORKFLOW", ""),
-            "run_id": os.environ.get("GITHUB_RUN_ID", ""),
-            "run_number": os.environ.get("GITHUB_RUN_NUMBER", ""),
-            "event_name": os.environ.get("GITHUB_EVENT_NAME", ""),
-            "server_url": os.environ.get("GITHUB_SERVER_URL", "https://github.com"),
+            "repository": env.get("GITHUB_REPOSITORY", self.repo or ""),
+            "ref": env.get("GITHUB_REF", ""),
+            "sha": env.get("GITHUB_SHA", ""),
+            "actor": env.get("GITHUB_ACTOR", ""),
+            "workflow": env.get("GITHUB_WORKFLOW", ""),
+            "run_id": env.get("GITHUB_RUN_ID", ""),
+            "run_number": env.get("GITHUB_RUN_NUMBER", ""),
+            "event_name": env.get("GITHUB_EVENT_NAME", ""),
+            "server_url": env.get("GITHUB_SERVER_URL", "https://github.com"),
         }
 
-    def _fetch(self, url: str) -> Any:
-        """Fetch URL with authentication"""
-        headers = {"Authorization": f"token {self.token}"} if self.token else {}
+    def _get_session(self):
+        """Shared requests session so API calls and webhooks reuse connections"""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                # Retry transient 429/5xx replies on the pooled connection
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset({"GET", "POST"}),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=4, pool_maxsize=8, max_retries=retry
+                )
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def _cache_path(self, url: str) -> Path:
+        """Cache file for a URL"""
+        return CACHE_DIR / hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _read_cache(self, url: str) -> Optional[Tuple[str, bytes]]:
+        """Return the cached (etag, body) for a URL, if any"""
+        try:
+            etag, _, body = self._cache_path(url).read_bytes().partition(b"\n")
+        except OSError:
+            return None
+        return (etag.decode("utf-8"), body) if etag else None
+
+    def _cache_age(self, url: str) -> float:
+        """Seconds since the cache entry for a URL was written or revalidated"""
+        try:
+            return time.time() - self._cache_path(url).stat().st_mtime
+        except OSError:
+            return float("inf")
+
+    def _touch_cache(self, url: str):
+        """Mark a cache entry as freshly revalidated"""
+        try:
+            os.utime(self._cache_path(url))
+        except OSError:
+            pass
+
+    def _write_cache(self, url: str, etag: str, body: bytes):
+        """Atomically store the ETag and body for a URL"""
+        path = self._cache_path(url)
+        tmp = path.with_suffix(".tmp")
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(etag.encode("utf-8") + b"\n" + body)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # Caching is best effort
+
+    def _get(self, url: str, headers: Dict[str, str]) -> Tuple[int, Any, bytes]:
+        """GET a URL, returning (status, headers, body)"""
+        if HAS_REQUESTS:
+            # Keep-alive pool: repeated api.github.com calls skip the TLS handshake
+            response = self._get_session().get(url, headers=headers, timeout=(3, 30))
+            return response.status_code, response.headers, response.content
+        import urllib.error
+        import urllib.request
+
         req = urllib.request.Request(url, headers=headers)
         try:
             with urllib.request.urlopen(req) as response:
-                if url.endswith("/logs"):
-                    return response.read().decode("utf-8")
-                else:
-                    return json.loads(response.read())
+                return response.status, response.headers, _decoded(response).read()
         except urllib.error.HTTPError as e:
-            if e.code != 403:  # Don't print for forbidden (logs often restricted)
-                print(f"Error fetching {url}: {e.code}")
+            return e.code, e.headers, b""
+
+    def clear_cache(self):
+        """Forget responses memoized by this process (e.g. between polls)"""
+        self._responses.clear()
+
+    def _fetch(self, url: str, cache: bool = True, max_age: float = 0) -> Any:
+        """Fetch URL, memoized per process unless it is a log download"""
+        # Logs are large one-shot downloads that redirect to blob storage
+        cache = cache and not url.endswith("/logs")
+        if cache and url in self._responses:
+            return self._responses[url]
+        data = self._fetch_url(url, cache, max_age)
+        if cache and data is not None:
+            self._responses[url] = data
+        return data
+
+    def _fetch_url(self, url: str, cache: bool, max_age: float = 0) -> Any:
+        """Fetch URL with authentication, optionally as an ETag conditional request
+
+        A cached body younger than max_age seconds is returned without a request.
+        """
+        cached = self._read_cache(url) if cache else None
+        if cached and max_age > 0 and self._cache_age(url) < max_age:
+            return _parse_json(cached[1])
+        headers = self._headers
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+        status, response_headers, body = self._get(url, headers)
+        if status == 304 and cached:
+            self._touch_cache(url)
+            return _parse_json(cached[1])
+        if status >= 300:
+            if status != 403:  # Don't print for forbidden (logs often restricted)
+                print(f"Error fetching {url}: {status}")
+            return None
+        if url.endswith("/logs"):
+            return body.decode("utf-8")
+        etag = response_headers.get("ETag")
+        if cache and etag:
+            self._write_cache(url, etag, body)
+        return _parse_json(body)
+
+    def _graphql(
+        self, query: str, variables: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """POST a GraphQL query, returning its data or None on any error"""
+        payload = json.dumps({"query": query, "variables": variables}).encode("utf-8")
+        headers = {**self._headers, "Content-Type": "application/json"}
+        try:
+            if HAS_REQUESTS:
+                response = self._get_session().post(
+                    GRAPHQL_URL, data=payload, headers=headers, timeout=(3, 30)
+                )
+                response.raise_for_status()
+                result = response.json()
+            else:
+                import urllib.request
+
+                req = urllib.request.Request(GRAPHQL_URL, data=payload, headers=headers)
+                with urllib.request.urlopen(req) as response:
+                    result = json.loads(_decoded(response).read())
+        except Exception as e:
+            print(f"GraphQL query failed: {e}")
+            return None
+        if result.get("errors"):
+            print(f"GraphQL query failed: {result['errors'][0].get('message')}")
             return None
+        return result.get("data")
+
+    def _iter_log_lines(self, url: str) -> Iterator[bytes]:
+        """Stream a job log line by line instead of buffering the whole blob"""
+        if HAS_REQUESTS:
+            with self._get_session().get(
+                url, headers=self._headers, stream=True, timeout=(3, 30)
+            ) as response:
+                status = response.status_code
+                if status < 300:
+                    yield from response.iter_lines()
+        else:
+            import urllib.error
+            import urllib.request
+
+            req = urllib.request.Request(url, headers=self._headers)
+            try:
+                with urllib.request.urlopen(req) as response:
+                    status = response.status
+                    yield from _decoded(response)
+            except urllib.error.HTTPError as e:
+                status = e.code
+        if status >= 300 and status != 403:  # Logs are often restricted
+            print(f"Error fetching {url}: {status}")
+
+    def _scan_log(self, url: str, limit: int = 5) -> List[str]:
+        """Return the first `limit` error lines of a job log"""
+        error_lines: List[str] = []
+        for raw in self._iter_log_lines(url):
+            # Match on the raw bytes; only the few hits get decoded
+            if ERROR_LINE_RE.search(raw):
+                error_lines.append(raw.decode("utf-8", "replace").strip())
+                if len(error_lines) >= limit:
+                    break  # Don't download the rest of the log
+        return error_lines
+
+    def _fetch_many(
+        self, urls: List[str], fetch: Optional[Callable[[str], Any]] = None
+    ) -> Dict[str, Any]:
+        """Fetch independent URLs concurrently, returning results keyed by URL"""
+        urls = list(dict.fromkeys(urls))  # Drop duplicates, keep order
+        if not urls:
+            return {}
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Bounded so bursts stay clear of GitHub's secondary rate limits
+        workers = min(FETCH_WORKERS, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(urls, executor.map(fetch or self._fetch, urls)))
+
+    def fetch_jobs(self, runs: List[Dict]) -> Dict[int, Dict[str, Any]]:
+        """Fetch the jobs of several runs in one GraphQL request
+
+        Returns REST-shaped jobs payloads keyed by run ID; runs that could not
+        be resolved are left out so callers can fall back to the REST API.
+        """
+        node_ids = [run["node_id"] for run in runs if run.get("node_id")]
+        if not node_ids or not self.token:  # GraphQL always needs a token
+            return {}
+        data = self._graphql(RUN_JOBS_QUERY, {"ids": node_ids})
+        if not data:
+            return {}
 
-    def fetch_runs(self, per_page: int = 50) -> Dict[str, Any]:
-        """Fetch workflow runs from GitHub API"""
+        def lower(value: Optional[str]) -> Optional[str]:
+            # GraphQL enums are upper case (FAILURE), REST uses "failure"
+            return value.lower() if value else value
+
+        jobs_by_run: Dict[int, Dict[str, Any]] = {}
+        for node in data.get("nodes") or []:
+            if not node or not node.get("checkSuite"):
+                continue
+            jobs = [
+                {
+                    "id": check_run["databaseId"],
+                    "name": check_run["name"],
+                    "conclusion": lower(check_run["conclusion"]),
+                    "steps": [
+                        {"name": step["name"], "conclusion": lower(step["conclusion"])}
+                        for step in check_run["steps"]["nodes"]
+                    ],
+                }
+                for check_run in node["checkSuite"]["checkRuns"]["nodes"]
+            ]
+            jobs_by_run[node["databaseId"]] = {"jobs": jobs}
+        return jobs_by_run
+
+    def fetch_runs(
+        self, per_page: int = 50, status: str = "completed"
+    ) -> Dict[str, Any]:
+        """Fetch workflow runs from GitHub API
+
+        status also accepts a conclusion such as "failure", which GitHub
+        filters on server-side.
+        """
         if not self.repo:
             raise ValueError("Repository not detected")
-        url = f"https://api.github.com/repos/{self.repo}/actions/runs?status=completed&per_page={per_page}"
-        return self._fetch(url)
+        # The pull_requests arrays are never read; leaving them out trims
+        # the payload that has to be transferred and decoded
+        url = (
+            f"https://api.github.com/repos/{self.repo}/actions/runs"
+            f"?status={status}&exclude_pull_requests=true&per_page={per_page}"
+        )
+        try:
+            ttl = float(os.environ.get("GH_MONITOR_TTL", DEFAULT_RUNS_TTL))
+        except ValueError:
+            ttl = DEFAULT_RUNS_TTL
+        return self._fetch(url, max_age=ttl)
 
-    def format_time_ago(self, date: datetime) -> str:
+    def format_time_ago(self, date: datetime, now: Optional[datetime] = None) -> str:
         """Format time difference as human-readable string"""
-        time_ago = datetime.now(timezone.utc).replace(tzinfo=None) - date
-        if time_ago.days > 0:
-            return f"{time_ago.days}d ago"
-        elif time_ago.seconds > 3600:
-            return f"{time_ago.seconds // 3600}h ago"
+        if now is None:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+        # total_seconds rather than .seconds: the latter wraps for negative
+        # deltas (clock skew), turning "just now" into "23h ago"
+        seconds = max(int((now - date).total_seconds()), 0)
+        if seconds >= 86400:
+            return f"{seconds // 86400}d ago"
+        elif seconds > 3600:
+            return f"{seconds // 3600}h ago"
         else:
-            return f"{time_ago.seconds // 60}m ago"
+            return f"{seconds // 60}m ago"
 
     def list_failures(self, count: int = 5, simple: bool = False) -> List[Dict]:
         """List recent failures"""
         print(f"📂 Repository: {self.repo}")
         print(f"🔍 Fetching last {count} failures...\n")
 
-        data = self.fetch_runs()
+        if simple:
+            # No failure-rate stats to compute, so let GitHub filter and send
+            # only the failed runs
+            data = self.fetch_runs(per_page=min(max(count, 1), 100), status="failure")
+        else:
+            data = self.fetch_runs()
         if not data:
             print("❌ Could not fetch workflow runs")
             return []
 
         all_runs = data["workflow_runs"]
-        failures = [r for r in all_runs if r["conclusion"] == "failure"][:count]
+        # Collect the first `count` failures and the failure total in one pass
+        failures: List[Dict] = []
+        total_failures = 0
+        for run in all_runs:
+            if run["conclusion"] == "failure":
+                total_failures += 1
+                if len(failures) < count:
+                    failures.append(run)
 
         if not failures:
             print("✅ No recent failures! Great job! 🎉")
             return []
 
-        print(f"🚨 Last {len(failures)} failures:\n")
-        print("-" * 60)
+        # Build the whole listing and write it once rather than print per line
+        lines = [f"🚨 Last {len(failures)} failures:\n", "-" * 60]
 
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
         for run in failures:
-            date = datetime.strptime(run["created_at"], "%Y-%m-%dT%H:%M:%SZ")
-            time_str = self.format_time_ago(date)
+            date = _parse_timestamp(run["created_at"])
+            time_str = self.format_time_ago(date, now)
 
             if simple:
-                print(
+                lines.append(
                     f"❌ {date.strftime('%m/%d %H:%M')} - {run['name'][:30]} - {run['head_branch'][:20]}"
                 )
             else:
-                print(f"❌ {run['name']} #{run['run_number']} - {time_str}")
-                print(f"   📅 {date.strftime('%Y-%m-%d %H:%M UTC')}")
-                print(f"   🌿 Branch: {run['head_branch']}")
-                print(f"   👤 Author: {run['head_commit']['author']['name']}")
-                print(f"   💬 {run['head_commit']['message'].split(chr(10))[0][:50]}")
-                print(f"   🔗 {run['html_url']}")
-                print()
+                lines += [
+                    f"❌ {run['name']} #{run['run_number']} - {time_str}",
+                    f"   📅 {date.strftime('%Y-%m-%d %H:%M UTC')}",
+                    f"   🌿 Branch: {run['head_branch']}",
+                    f"   👤 Author: {run['head_commit']['author']['name']}",
+                    f"   💬 {run['head_commit']['message'].split(chr(10))[0][:50]}",
+                    f"   🔗 {run['html_url']}",
+                    "",
+                ]
 
         # Show stats
         if failures and not simple:
-            total_failures = len([r for r in all_runs if r["conclusion"] == "failure"])
             if all_runs:
                 failure_rate = (total_failures / len(all_runs)) * 100
-                print("-" * 60)
-                print(
-                    f"📊 Stats: {failure_rate:.1f}% failure rate (last {len(all_runs)} runs)"
-                )
+                lines += [
+                    "-" * 60,
+                    f"📊 Stats: {failure_rate:.1f}% failure rate (last {len(all_runs)} runs)",
+                ]
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         return failures
 
     def analyze_failures(self, run_ids: Optional[List[int]] = None) -> Dict[str, Any]:
         """Analyze specific workflow runs in detail"""
+        # Run payloads already returned by the runs listing, keyed by ID
+        known_runs: Dict[int, Dict] = {}
         if not run_ids:
             # Get recent failures
             data = self.fetch_runs(per_page=10)
@@ -170,21 +545,57 @@ class GitHubMonitor:
                 print("❌ Could not fetch workflow runs")
                 return {}
 
-            failures = [
-                r for r in data["workflow_runs"] if r["conclusion"] == "failure"
-            ][:3]
-            run_ids = [r["id"] for r in failures]
+            failures = islice(
+                (r for r in data["workflow_runs"] if r["conclusion"] == "failure"), 3
+            )
+            known_runs = {r["id"]: r for r in failures}
+            run_ids = list(known_runs)
+
+        # Jobs for runs we already hold come back in a single GraphQL round
+        # trip. Anything else (unknown runs, or GraphQL unavailable) is looked
+        # up over REST; those lookups are independent, so issue them
+        # concurrently and keep the printing below in run order
+        jobs_by_run = self.fetch_jobs(list(known_runs.values()))
+        runs_url = f"https://api.github.com/repos/{self.repo}/actions/runs"
+        urls = [
+            f"{runs_url}/{run_id}/jobs"
+            for run_id in run_ids
+            if run_id not in jobs_by_run
+        ]
+        urls += [
+            f"{runs_url}/{run_id}" for run_id in run_ids if run_id not in known_runs
+        ]
+        responses = self._fetch_many(urls)
+
+        details = [
+            (
+                run_id,
+                known_runs.get(run_id) or responses.get(f"{runs_url}/{run_id}"),
+                jobs_by_run.get(run_id) or responses.get(f"{runs_url}/{run_id}/jobs"),
+            )
+            for run_id in run_ids
+        ]
+
+        # Failed jobs' logs are independent downloads as well; each is
+        # streamed only until its first few error lines turn up
+        jobs_url = f"https://api.github.com/repos/{self.repo}/actions/jobs"
+        errors_by_url = self._fetch_many(
+            [
+                f"{jobs_url}/{job['id']}/logs"
+                for _, run_data, jobs_data in details
+                if run_data and jobs_data
+                for job in jobs_data.get("jobs", [])
+                if job["conclusion"] == "failure"
+            ],
+            self._scan_log,
+        )
 
         all_failures = []
-        for run_id in run_ids:
+        for run_id, run_data, jobs_data in details:
             print(f"\n{'='*60}")
             print(f"Analyzing Run ID: {run_id}")
             print("=" * 60)
 
-            # Get run details
-            run_data = self._fetch(
-                f"https://api.github.com/repos/{self.repo}/actions/runs/{run_id}"
-            )
             if not run_data:
                 continue
 
@@ -194,10 +605,6 @@ class GitHubMonitor:
             print(f"Branch: {run_data['head_branch']}")
             print(f"Commit: {run_data['head_sha'][:8]}")
 
-            # Get jobs
-            jobs_data = self._fetch(
-                f"https://api.github.com/repos/{self.repo}/actions/runs/{run_id}/jobs"
-            )
             if not jobs_data:
                 continue
 
@@ -211,38 +618,26 @@ class GitHubMonitor:
                         if step["conclusion"] == "failure":
                             print(f"   Failed Step: {step['name']}")
 
-                    # Try to get logs
-                    logs_url = f"https://api.github.com/repos/{self.repo}/actions/jobs/{job['id']}/logs"
-                    logs = self._fetch(logs_url)
-
-                    if logs:
-                        error_lines = []
-                        for line in logs.split("\n"):
-                            if "error" in line.lower() or "failed" in line.lower():
-                                error_lines.append(line.strip())
-
-                        if error_lines:
-                            print("\n   Key Error Messages:")
-                            for error in error_lines[:5]:
-                                if error:
-                                    print(f"   > {error[:120]}")
+                    # Logs may be missing (403 when restricted)
+                    error_lines = errors_by_url.get(f"{jobs_url}/{job['id']}/logs")
+                    if error_lines:
+                        print("\n   Key Error Messages:")
+                        for error in error_lines:
+                            print(f"   > {error[:120]}")
 
         # Summary
         if all_failures:
-            print(f"\n{'='*60}")
-            print("SUMMARY OF FAILURES")
-            print("=" * 60)
-
-            job_names: Dict[str, int] = {}
-            for job in all_failures:
-                name = job["name"]
-                job_names[name] = job_names.get(name, 0) + 1
-
-            print("\nFailed Jobs by Frequency:")
-            for name, count in sorted(
-                job_names.items(), key=lambda x: x[1], reverse=True
-            ):
-                print(f"  {name}: {count} failures")
+            job_names = Counter(job["name"] for job in all_failures)
+            lines = [
+                f"\n{'='*60}",
+                "SUMMARY OF FAILURES",
+                "=" * 60,
+                "\nFailed Jobs by Frequency:",
+            ]
+            lines += [
+                f"  {name}: {count} failures" for name, count in job_names.most_common()
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
 
         return {"failures": all_failures, "summary": job_names if all_failures else {}}
 
@@ -260,20 +655,19 @@ class GitHubMonitor:
             ] = f"{self.github_context['server_url']}/{self.repo}/actions/runs/{self.github_context['run_id']}"
 
         report["environment"] = {
-            "python_version": sys.version.split()[0],
+            "python_version": self._python_version,
             "runner_os": os.environ.get("RUNNER_OS", "local"),
             "runner_arch": os.environ.get("RUNNER_ARCH", "unknown"),
         }
 
         return report
 
-    def send_webhook(self, webhook_url: str, webhook_type: str = "slack") -> bool:
-        """Send notification to webhook"""
-        if not HAS_REQUESTS:
-            print("❌ requests library not available for webhooks")
-            return False
-
-        report = self.generate_report()
+    def build_webhook_message(
+        self, webhook_type: str = "slack", report: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the notification payload for a webhook type"""
+        if report is None:
+            report = self.generate_report()
 
         if webhook_type == "slack":
             message = {
@@ -285,9 +679,7 @@ class GitHubMonitor:
                             {"title": "Repository", "value": self.repo, "short": True},
                             {
                                 "title": "Branch",
-                                "value": self.github_context["ref"].replace(
-                                    "refs/heads/", ""
-                                ),
+                                "value": self._branch,
                                 "short": True,
                             },
                             {
@@ -322,9 +714,7 @@ class GitHubMonitor:
                         "fields": [
                             {
                                 "name": "Branch",
-                                "value": self.github_context["ref"].replace(
-                                    "refs/heads/", ""
-                                ),
+                                "value": self._branch,
                                 "inline": True,
                             },
                             {
@@ -340,9 +730,26 @@ class GitHubMonitor:
             }
         else:
             message = report
+        return message
+
+    def send_webhook(
+        self,
+        webhook_url: str,
+        webhook_type: str = "slack",
+        message: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Send notification to webhook"""
+        if not HAS_REQUESTS:
+            print("❌ requests library not available for webhooks")
+            return False
+
+        if message is None:
+            message = self.build_webhook_message(webhook_type)
 
         try:
-            response = requests.post(webhook_url, json=message)
+            response = self._get_session().post(
+                webhook_url, json=message, timeout=(3, 10)
+            )
             response.raise_for_status()
             print("✅ Webhook notification sent successfully")
             return True
@@ -350,6 +757,34 @@ class GitHubMonitor:
             print(f"❌ Failed to send webhook: {e}")
             return False
 
+    def send_webhooks(
+        self,
+        webhook_urls: List[str],
+        webhook_type: str = "slack",
+        report: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Send notifications to several webhooks concurrently"""
+        if not HAS_REQUESTS:
+            print("❌ requests library not available for webhooks")
+            return False
+
+        # The payload is identical for every URL, so build it once
+        message = self.build_webhook_message(webhook_type, report)
+        if len(webhook_urls) == 1:
+            return self.send_webhook(webhook_urls[0], webhook_type, message)
+
+        # Each post is an independent network round-trip; overlap them so the
+        # total wait is the slowest endpoint rather than the sum of all of them
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=min(4, len(webhook_urls))) as executor:
+            futures = [
+                executor.submit(self.send_webhook, url, webhook_type, message)
+                for url in webhook_urls
+            ]
+            results = [future.result() for future in as_completed(futures)]
+        return any(results)
+
     def export_json(self, failures: List[Dict], filename: str):
         """Export failures to JSON file"""
         data = {
@@ -372,8 +807,7 @@ class GitHubMonitor:
             ],
         }
 
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=2)
+        _write_json(filename, data)
 
         print(f"✅ Exported {len(failures)} failures to {filename}")
 
@@ -406,7 +840,11 @@ def main():
         "--simple", "-s", action="store_true", help="Simple one-line output format"
     )
     parser.add_argument(
-        "--webhook", "-w", metavar="URL", help="Send notification to webhook"
+        "--webhook",
+        "-w",
+        metavar="URL",
+        action="append",
+        help="Send notification to webhook (repeat for multiple webhooks)",
     )
     parser.add_argument(
         "--webhook-type",
@@ -432,14 +870,14 @@ def main():
         print("✅ Using GitHub token from .env file")
 
     # Handle commands
+    report = None
     if args.command == "analyze":
         monitor.analyze_failures()
     elif args.command == "report":
         report = monitor.generate_report()
         print(json.dumps(report, indent=2))
         if args.json:
-            with open(args.json, "w") as f:
-                json.dump(report, f, indent=2)
+            _write_json(args.json, report)
             print(f"✅ Report saved to {args.json}")
     else:  # list
         failures = monitor.list_failures(count=args.count, simple=args.simple)
@@ -447,9 +885,9 @@ def main():
         if args.json and failures:
             monitor.export_json(failures, args.json)
 
-    # Send webhook if requested
+    # Send webhooks if requested
     if args.webhook:
-        monitor.send_webhook(args.webhook, args.webhook_type)
+        monitor.send_webhooks(args.webhook, args.webhook_type, report)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+"""
+JSON schema examples for the API models.
+
+Kept out of models.py so the examples are only loaded when documentation or
+OpenAPI output needs them (NAPKIN_ENABLE_OPENAPI_EXAMPLES).
+"""
+
+from typing import Dict, List, Type
+
+from pydantic import BaseModel, JsonValue
+
+# Examples keyed by model class name
+MODEL_EXAMPLES: Dict[str, List[JsonValue]] = {
+    "VisualRequest": [
+        {
+            "content": "Machine Learning Pipeline",
+            "format": "svg",
+            "style_id": "CDQPRVVJCSTPRBBCD5Q6AWR",
+            "language": "en-US",
+            "number_of_visuals": 2,
+        },
+        {
+            "content": "Data flow diagram",
+            "format": "png",
+            "width": 1024,
+            "height": 768,
+            "transparent_background": True,
+            "inverted_color": False,
+        },
+    ],
+    "GeneratedFile": [
+        {
+            "id": "426614174000-wdjvjhwv8",
+            "url": "https://api.napkin.ai/v1/visual/123e4567-e89b-12d3-a456-426614174000/file/426614174000-wdjvjhwv8",
+            "format": "svg",
+            "filename": "visual.svg",
+            "size_bytes": 245760,
+            "created_at": "2025-01-01T12:00:00Z",
+        }
+    ],
+    "VisualResponse": [
+        {
+            "request_id": "REQ_abcd1234",
+            "status": "processing",
+            "created_at": "2025-01-01T12:00:00Z",
+            "updated_at": "2025-01-01T12:00:10Z",
+            "files": [],
+        },
+        {
+            "request_id": "REQ_abcd1234",
+            "status": "completed",
+            "created_at": "2025-01-01T12:00:00Z",
+            "updated_at": "2025-01-01T12:00:30Z",
+            "files": [
+                {
+                    "id": "FILE_abc123",
+                    "url": "https://cdn.example.com/files/FILE_abc123.png",
+                    "format": "png",
+                    "width": 1024,
+                    "height": 768,
+                    "size_bytes": 345678,
+                }
+            ],
+        },
+    ],
+    "StatusResponse": [
+        {
+            "request_id": "REQ_abcd1234",
+            "status": "processing",
+            "progress": 42.5,
+            "message": "Rendering variants...",
+            "files_ready": 1,
+            "files_total": 3,
+        }
+    ],
+    "ErrorResponse": [
+        {
+            "error": "width and height can only be set when format=png",
+            "code": "VALIDATION_ERROR",
+            "details": {"field": "width"},
+            "request_id": "REQ_abcd1234",
+            "timestamp": "2025-01-01T12:00:30Z",
+        }
+    ],
+    "RateLimitInfo": [
+        {"limit": 60, "remaining": 0, "reset_epoch": 1735732860, "retry_after": 30}
+    ],
+}
+
+
+def attach_examples(*models: Type[BaseModel]) -> None:
+    """Attach the examples to each model's JSON schema (json_schema_extra)."""
+    for model in models:
+        examples = MODEL_EXAMPLES.get(model.__name__)
+        if examples:
+            model.model_config["json_schema_extra"] = {"examples": examples}
@@ -6,33 +6,116 @@ including authentication, rate limiting, and exponential backoff.
 """
 
 import asyncio
+import contextlib
+import importlib.util
+import json
 import logging
+import os
+import random
+import re
+import sys
+import time
+import urllib.parse
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-    before_sleep_log,
-)
 
 from ..utils.config import Settings, get_settings
 from ..utils.constants import API_ENDPOINTS, HTTP_STATUS
 from .models import (
+    MAX_RESET_EPOCH,
+    TERMINAL_STATUSES,
     RateLimitInfo,
     RequestStatus,
     StatusResponse,
     VisualRequest,
     VisualResponse,
+    decode_status_body,
 )
 
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 lets status polls and file downloads share one multiplexed
+# connection; httpx only supports it when the optional h2 package is present
+HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Content-Disposition filename parameters: an RFC 5987 extended value
+# (charset'lang'pct-encoded), a quoted string (which may contain ';' and
+# backslash escapes) or a bare token. filename* wins over filename.
+_CD_FILENAME_RE = re.compile(
+    r"\bfilename(?P<star>\*)?\s*=\s*(?:"
+    r"(?P<charset>[\w!#$%&+^`{}~-]+)'[^']*'(?P<encoded>[^;\s]*)"
+    r'|"(?P<quoted>(?:[^"\\]|\\.)*)"'
+    r"|(?P<token>[^;]+))",
+    re.IGNORECASE,
+)
+_CD_ESCAPE_RE = re.compile(r"\\(.)")
+
+# Most requests whose last status is kept for conditional polling
+_STATUS_CACHE_SIZE = 128
+
+# orjson is optional; it parses several times faster than json
+try:
+    import orjson  # type: ignore
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# ciso8601 is an optional C parser for ISO 8601 timestamps
+try:
+    import ciso8601  # type: ignore
+
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON response body."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _header_int(value: Optional[str]) -> Optional[int]:
+    """Parse a non-negative integer header value; None if absent or malformed."""
+    if value is None:
+        return None
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        return None
+
+
+def _write_all(fd: int, data: bytes) -> int:
+    """Write all of data to fd, returning the number of bytes written."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+    return len(data)
+
+
+def _running_loop_id() -> Optional[int]:
+    """Identify the running event loop, or None outside of one."""
+    try:
+        return id(asyncio.get_running_loop())
+    except RuntimeError:
+        return None
+
 
 class NapkinAPIError(Exception):
     """Base exception for Napkin API errors."""
@@ -74,6 +157,10 @@ class ProcessingError(NapkinAPIError):
 class NapkinAPIClient:
     """Async client for Napkin AI API."""
 
+    # HTTP clients shared across instances when settings.share_client is set,
+    # keyed by event loop and client configuration
+    _shared_clients: ClassVar[Dict[Tuple[Any, ...], httpx.AsyncClient]] = {}
+
     def __init__(self, settings: Optional[Settings] = None):
         """
         Initialize API client.
@@ -85,21 +172,95 @@ class NapkinAPIClient:
         self.base_url = f"{self.settings.api_base_url}/{self.settings.api_version}"
         self.headers = self.settings.get_headers()
 
+        # Full URL templates for the hot polling/download paths, so each call
+        # is a single %-format instead of .format() plus a base_url join
+        base = self.base_url.replace("%", "%%")
+        self._status_tmpl = base + API_ENDPOINTS["get_status"].replace(
+            "{request_id}", "%s"
+        )
+        self._file_tmpl = base + API_ENDPOINTS["get_file"].replace(
+            "{request_id}", "%s"
+        ).replace("{file_id}", "%s")
+
         # HTTP client with timeout
         # Allow optional client injection and granular timeouts
-        self._owns_client = True
-        self.client = httpx.AsyncClient(
+        if self.settings.share_client:
+            self.client = type(self).shared_client(self.settings)
+            self._owns_client = False
+        else:
+            self.client = self._build_client(self.settings, self.headers)
+            self._owns_client = True
+
+        # Rate limit tracking
+        self.rate_limit_info: Optional[RateLimitInfo] = None
+
+        # Validators (ETag, Last-Modified) and last status per polled request,
+        # least recently polled first
+        self._status_cache: OrderedDict[
+            str, Tuple[Optional[str], Optional[str], StatusResponse]
+        ] = OrderedDict()
+
+        # Download tuning, read once rather than on every download
+        self._chunk_size = self._get_int_env(
+            "NAPKIN_DOWNLOAD_CHUNK_SIZE", default=65536
+        )
+        self._overwrite = self._get_bool_env("NAPKIN_DOWNLOAD_OVERWRITE", default=False)
+
+    @staticmethod
+    def _build_client(settings: Settings, headers: Dict[str, str]) -> httpx.AsyncClient:
+        """Create an HTTP client configured from settings."""
+        return httpx.AsyncClient(
             timeout=httpx.Timeout(
-                connect=self.settings.timeout_seconds,
-                read=self.settings.timeout_seconds,
-                write=self.settings.timeout_seconds,
-                pool=self.settings.timeout_seconds,
+                connect=settings.timeout_seconds,
+                read=settings.timeout_seconds,
+                write=settings.timeout_seconds,
+                pool=settings.timeout_seconds,
+            ),
+            # Keep idle connections around long enough to span the polling
+            # backoff (up to 30s) so status polls and downloads skip new
+            # TLS handshakes
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry_seconds,
             ),
-            headers=self.headers,
+            http2=HAS_HTTP2,
+            headers=headers,
         )
 
-        # Rate limit tracking
-        self.rate_limit_info: Optional[RateLimitInfo] = None
+    @classmethod
+    def shared_client(cls, settings: Settings) -> httpx.AsyncClient:
+        """
+        Get the process-wide HTTP client for settings, creating it on first use.
+
+        Clients are shared between instances running on the same event loop
+        with the same base URL, timeout, pool limits and headers, so they reuse
+        open connections. Pooled connections belong to the loop that opened
+        them, which is why each loop gets its own clients; close them with
+        aclose_shared() before that loop ends.
+        """
+        headers = settings.get_headers()
+        key = (
+            _running_loop_id(),
+            settings.api_url,
+            settings.timeout_seconds,
+            settings.max_connections,
+            settings.max_keepalive_connections,
+            settings.keepalive_expiry_seconds,
+            tuple(sorted(headers.items())),
+        )
+        client = cls._shared_clients.get(key)
+        if client is None or client.is_closed:
+            client = cls._shared_clients[key] = cls._build_client(settings, headers)
+        return client
+
+    @classmethod
+    async def aclose_shared(cls) -> None:
+        """Close the running loop's shared HTTP clients, e.g. on shutdown."""
+        loop_ids = {_running_loop_id(), None}
+        keys = [key for key in cls._shared_clients if key[0] in loop_ids]
+        for key in keys:
+            await cls._shared_clients.pop(key).aclose()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -119,71 +280,50 @@ class NapkinAPIClient:
         self, response: httpx.Response
     ) -> Optional[RateLimitInfo]:
         """Extract rate limit information from response headers."""
-        try:
-            headers = response.headers
+        headers = response.headers
+        limit_hdr = headers.get("X-RateLimit-Limit")
+        retry_after_hdr = headers.get("Retry-After")
 
-            if "X-RateLimit-Limit" in headers or "Retry-After" in headers:
-                # Parse limit/remaining defensively
-                try:
-                    limit = int(headers.get("X-RateLimit-Limit", "60"))
-                except (ValueError, TypeError):
-                    limit = 60
-                try:
-                    remaining = int(headers.get("X-RateLimit-Remaining", "0"))
-                except (ValueError, TypeError):
-                    remaining = 0
-
-                # Parse reset timestamp robustly
-                reset = None
-                reset_hdr = headers.get("X-RateLimit-Reset")
-                retry_after_val = headers.get("Retry-After")
+        # Most responses (e.g. successful status polls) carry neither header
+        if limit_hdr is None and retry_after_hdr is None:
+            return None
 
-                try:
-                    if reset_hdr is not None:
-                        reset = datetime.fromtimestamp(int(reset_hdr))
-                except (ValueError, TypeError, OSError):
-                    # If reset is invalid but Retry-After present, compute approximate reset
-                    if retry_after_val is not None:
-                        try:
-                            ra = int(retry_after_val)
-                            # Use timezone-aware UTC
-                            reset = datetime.fromtimestamp(
-                                int(datetime.now(timezone.utc).timestamp()) + ra,
-                                tz=timezone.utc,
-                            )
-                        except (ValueError, TypeError):
-                            reset = None
-
-                # Parse retry-after seconds
-                retry_after = None
-                try:
-                    if retry_after_val is not None:
-                        retry_after = int(retry_after_val)
-                except (ValueError, TypeError):
-                    retry_after = None
-
-                if reset is not None:
-                    return RateLimitInfo(
-                        limit=limit,
-                        remaining=remaining,
-                        reset=reset,
-                        retry_after=retry_after,
-                    )
-                else:
-                    # If reset is None, skip creating RateLimitInfo
-                    return None
-        except Exception as e:
-            logger.warning(f"Failed to parse rate limit headers: {e}")
-        return None
+        limit = _header_int(limit_hdr)
+        retry_after = _header_int(retry_after_hdr)
+        remaining = _header_int(headers.get("X-RateLimit-Remaining"))
+
+        # Prefer the absolute reset timestamp; otherwise derive it from Retry-After
+        reset_epoch = _header_int(headers.get("X-RateLimit-Reset"))
+        if reset_epoch is not None and reset_epoch > MAX_RESET_EPOCH:
+            reset_epoch = None  # Not a real timestamp; drop it
+        if reset_epoch is None:
+            if retry_after is None:
+                return None
+            reset_epoch = min(int(time.time()) + retry_after, MAX_RESET_EPOCH)
+
+        return RateLimitInfo(
+            limit=60 if limit is None else limit,
+            remaining=remaining or 0,
+            reset_epoch=reset_epoch,
+            retry_after=retry_after,
+        )
 
     def _handle_error_response(self, response: httpx.Response):
         """Handle API error responses."""
-        try:
-            error_data = response.json()
+        error_data = None
+        # Only try JSON for JSON bodies; empty and plain-text errors (e.g.
+        # from proxies) go straight to the text fallback
+        if response.content and "json" in response.headers.get("Content-Type", ""):
+            try:
+                error_data = _json_loads(response.content)
+            except ValueError:
+                pass
+
+        if isinstance(error_data, dict):
             error_msg = error_data.get("error", "Unknown error")
             error_code = error_data.get("code")
             details = error_data.get("details")
-        except Exception:
+        else:
             error_msg = response.text or f"HTTP {response.status_code} error"
             error_code = None
             details = None
@@ -199,24 +339,44 @@ class NapkinAPIClient:
         else:
             raise NapkinAPIError(error_msg, error_code, details)
 
-    @retry(
-        retry=retry_if_exception_type(httpx.HTTPError),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-    )
     async def _make_request(
         self,
         method: str,
         endpoint: str,
         **kwargs,
     ) -> httpx.Response:
-        """Make HTTP request with retry logic."""
-        url = f"{self.base_url}{endpoint}"
+        """
+        Make HTTP request with retry logic.
+
+        Transport errors (httpx.HTTPError) are retried up to max_retries times
+        with jittered exponential backoff (2s, 4s, 8s, capped at 10s); the last
+        error is re-raised. API error responses are not retried.
+        """
+        url = endpoint if endpoint.startswith("http") else self.base_url + endpoint
 
         logger.debug(f"{method} {url}")
 
-        response = await self.client.request(method, url, **kwargs)
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(method, url, **kwargs)
+                break
+            except httpx.HTTPError as e:
+                if attempt >= self.settings.max_retries:
+                    raise
+                delay = min(10, 2 * 2**attempt) + random.uniform(0, 0.1 * 2**attempt)
+                logger.warning(
+                    "%s %s failed (%s); retrying in %.1fs", method, url, e, delay
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+        logger.debug(
+            "%s %s -> %d (%s)",
+            method,
+            url,
+            response.status_code,
+            response.http_version,
+        )
 
         # Update rate limit info
         self.rate_limit_info = self._extract_rate_limit_info(response)
@@ -245,8 +405,8 @@ class NapkinAPIClient:
         """
         endpoint = API_ENDPOINTS["create_visual"]
 
-        # Prepare request data
-        request_data = request.model_dump(exclude_none=True)
+        # Serialize straight to JSON bytes with pydantic's Rust serializer
+        body = request.model_dump_json(exclude_none=True).encode("utf-8")
 
         # Log request without leaking content
         try:
@@ -259,11 +419,11 @@ class NapkinAPIClient:
         response = await self._make_request(
             "POST",
             endpoint,
-            json=request_data,
+            content=body,
         )
 
         # Parse response
-        response_data = response.json()
+        response_data = _json_loads(response.content)
         logger.debug(f"Create visual response: {response_data}")
 
         # Create response model
@@ -279,9 +439,13 @@ class NapkinAPIClient:
     def _parse_iso8601(self, s: str) -> datetime:
         """Parse ISO8601 timestamps, supporting trailing 'Z', returning timezone-aware UTC on fallback."""
         try:
-            if s.endswith("Z"):
-                return datetime.fromisoformat(s.replace("Z", "+00:00"))
-            dt = datetime.fromisoformat(s)
+            if HAS_CISO8601:
+                dt = ciso8601.parse_datetime(s)
+            elif s.endswith("Z") and sys.version_info < (3, 11):
+                # fromisoformat only understands a trailing "Z" from 3.11 on
+                dt = datetime.fromisoformat(s[:-1] + "+00:00")
+            else:
+                dt = datetime.fromisoformat(s)
             # Ensure timezone-aware; default to UTC if naive
             return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
         except Exception:
@@ -303,23 +467,38 @@ class NapkinAPIClient:
         Raises:
             NapkinAPIError: If request fails.
         """
-        endpoint = API_ENDPOINTS["get_status"].format(request_id=request_id)
+        # Revalidate the last status we saw; an unchanged request comes back as
+        # a bodiless 304 and skips JSON decoding entirely
+        cached = self._status_cache.get(request_id)
+        headers = {}
+        if cached:
+            self._status_cache.move_to_end(request_id)
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
 
         # Make API call
-        response = await self._make_request("GET", endpoint)
+        response = await self._make_request(
+            "GET", self._status_tmpl % request_id, headers=headers
+        )
+        if cached and response.status_code == HTTP_STATUS["not_modified"]:
+            logger.debug("Status for %s not modified", request_id)
+            return cached[2].model_copy()
 
         # Parse response and emit DEBUG to inspect actual structure
-        response_data = response.json()
-        logger.debug("Status response for %s: %s", request_id, response_data)
+        body = decode_status_body(response.content, _json_loads)
+        logger.debug("Status response for %s: %s", request_id, body)
 
         # The API may return:
         #   - generated_files: [{ id, url, format, filename?, size_bytes? }]
         #   - files:            same shape (legacy/alternate key)
         #   - urls:             [ "https://..." ] (legacy minimal)
         # Normalize while preserving raw structure in .files
-        raw_generated = response_data.get("generated_files")
-        raw_files = response_data.get("files")
-        raw_urls = response_data.get("urls")
+        raw_generated = body.generated_files
+        raw_files = body.files
+        raw_urls = body.urls
 
         # Prefer generated_files if present
         candidate = None
@@ -334,23 +513,34 @@ class NapkinAPIClient:
             files_ready = len(candidate)
             files_total = len(candidate)
         else:
-            files_ready = int(response_data.get("files_ready", 0) or 0)
-            files_total = int(response_data.get("files_total", 0) or 0)
+            files_ready = int(body.files_ready or 0)
+            files_total = int(body.files_total or 0)
 
         status_resp = StatusResponse(
             request_id=request_id,
-            status=RequestStatus(response_data["status"]),
-            progress=response_data.get("progress"),
-            message=response_data.get("message"),
+            status=RequestStatus(body.status),
+            progress=body.progress,
+            message=body.message,
             files_ready=files_ready,
             files_total=files_total,
-            error=response_data.get("error"),
+            error=body.error,
         )
 
         # Preserve whichever structure we received for downstream logic
         if candidate is not None:
             status_resp.files = candidate  # type: ignore[assignment]
 
+        # Terminal statuses are not polled again, so stop tracking them
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (etag or last_modified) and status_resp.status not in TERMINAL_STATUSES:
+            self._status_cache[request_id] = (etag, last_modified, status_resp)
+            self._status_cache.move_to_end(request_id)
+            if len(self._status_cache) > _STATUS_CACHE_SIZE:
+                self._status_cache.popitem(last=False)
+        else:
+            self._status_cache.pop(request_id, None)
+
         return status_resp
 
     async def download_file(
@@ -363,13 +553,26 @@ class NapkinAPIClient:
         Download a generated file by request/file ID.
         Streams to disk if save_path is provided to avoid large memory usage.
         """
-        endpoint = API_ENDPOINTS["get_file"].format(
-            request_id=request_id,
-            file_id=file_id,
-        )
-        url = f"{self.base_url}{endpoint}"
+        url = self._file_tmpl % (request_id, file_id)
         return await self._stream_or_bytes(url, save_path)
 
+    async def stream_file_by_url(self, url: str, dest: Union[str, Path]) -> Path:
+        """
+        Stream a file from a URL to an exact destination path.
+        Only one NAPKIN_DOWNLOAD_CHUNK_SIZE chunk is held in memory at a time.
+        """
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        async with self._open_stream(url) as r:
+            # Never leave a truncated file at the final path
+            try:
+                await self._write_stream(r, dest, self._chunk_size)
+            except BaseException:
+                dest.unlink(missing_ok=True)
+                raise
+        logger.info("Saved file to %s", dest)
+        return dest
+
     async def save_file_by_url(
         self,
         url: str,
@@ -388,17 +591,7 @@ class NapkinAPIClient:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Make streaming GET to obtain headers
-        async with self.client.stream("GET", url, headers=self.headers) as r:
-            if r.status_code >= 400:
-                body = await r.aread()
-                resp = httpx.Response(
-                    status_code=r.status_code,
-                    headers=r.headers,
-                    content=body,
-                    request=r.request,
-                )
-                self._handle_error_response(resp)
-
+        async with self._open_stream(url) as r:
             # Determine filename
             cd = r.headers.get("Content-Disposition", "") or r.headers.get(
                 "content-disposition", ""
@@ -431,20 +624,82 @@ class NapkinAPIClient:
 
             # Prepare final path and overwrite policy
             dest = output_dir / filename
-            overwrite = self._get_bool_env("NAPKIN_DOWNLOAD_OVERWRITE", default=False)
-            if dest.exists() and not overwrite:
+            if dest.exists() and not self._overwrite:
                 # Avoid clobber; add numeric suffix
                 dest = self._dedupe_path(dest)
 
-            # Chunked write
-            chunk_size = self._get_int_env("NAPKIN_DOWNLOAD_CHUNK_SIZE", default=65536)
-            with dest.open("wb") as f:
-                async for chunk in r.aiter_bytes(chunk_size=chunk_size):
-                    f.write(chunk)
+            # Chunked write; never leave a partial file behind
+            try:
+                await self._write_stream(r, dest, self._chunk_size)
+            except BaseException:
+                dest.unlink(missing_ok=True)
+                raise
 
         logger.info("Saved file to %s", dest)
         return dest
 
+    async def download_all(
+        self,
+        request_id: str,
+        files: Sequence[Tuple[str, Optional[str]]],
+        output_dir: Union[str, Path],
+        concurrency: Optional[int] = None,
+    ) -> List[Path]:
+        """
+        Download several files of a request concurrently.
+
+        Args:
+            request_id: The request the files belong to.
+            files: (file_id, url) pairs; files without a URL are fetched from
+                the API file endpoint.
+            output_dir: Directory to save the files into.
+            concurrency: Maximum simultaneous downloads (default: up to 8).
+
+        Returns:
+            Saved file paths, in the same order as files.
+
+        Raises:
+            NapkinAPIError: The first download that fails; the remaining
+                downloads are cancelled and their partial files removed.
+                Rate-limited downloads are retried after Retry-After, up to
+                max_retries times.
+        """
+        if not files:
+            return []
+        semaphore = asyncio.Semaphore(concurrency or min(8, len(files)))
+
+        async def download_one(file_id: str, url: Optional[str]) -> Path:
+            if not url:
+                url = self._file_tmpl % (request_id, file_id)
+            attempts = 0
+            async with semaphore:
+                while True:
+                    try:
+                        return await self.save_file_by_url(
+                            url, output_dir, request_id=request_id, file_id=file_id
+                        )
+                    except RateLimitError as e:
+                        attempts += 1
+                        if attempts > self.settings.max_retries:
+                            raise
+                        logger.warning(
+                            "Rate limited downloading %s; retrying in %ss",
+                            file_id,
+                            e.retry_after,
+                        )
+                        await asyncio.sleep(e.retry_after)
+
+        tasks = [asyncio.create_task(download_one(fid, url)) for fid, url in files]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Stop sibling downloads before surfacing the error so none keep
+            # writing (or sleeping through Retry-After) in the background
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def _stream_or_bytes(
         self, url: str, save_path: Optional[Path]
     ) -> Union[bytes, Path]:
@@ -452,28 +707,99 @@ class NapkinAPIClient:
         Helper to stream to disk if save_path is provided, otherwise return bytes.
         """
         if save_path:
-            save_path = Path(save_path)
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-            async with self.client.stream("GET", url, headers=self.headers) as r:
-                if r.status_code >= 400:
-                    body = await r.aread()
-                    resp = httpx.Response(
-                        status_code=r.status_code,
-                        headers=r.headers,
-                        content=body,
-                        request=r.request,
-                    )
-                    self._handle_error_response(resp)
-                with save_path.open("wb") as f:
-                    async for chunk in r.aiter_bytes():
-                        f.write(chunk)
-            logger.info("Saved file to %s", save_path)
-            return save_path
+            return await self.stream_file_by_url(url, save_path)
         # Return bytes
-        resp = await self.client.get(url, headers=self.headers)
-        if resp.status_code >= 400:
-            self._handle_error_response(resp)
-        return resp.content
+        return await self.download_file_by_url(url)
+
+    @contextlib.asynccontextmanager
+    async def iter_file(self, url: str) -> AsyncIterator[AsyncIterator[bytes]]:
+        """
+        Stream a file without buffering it in memory or on disk.
+
+        Usage:
+            async with client.iter_file(url) as chunks:
+                async for chunk in chunks:
+                    sink.write(chunk)
+
+        Chunks are NAPKIN_DOWNLOAD_CHUNK_SIZE bytes of the decoded body.
+
+        Raises:
+            NapkinAPIError: If the server responds with an error status.
+        """
+        async with self._open_stream(url) as r:
+            yield self._body_chunks(r, self._chunk_size)
+
+    @contextlib.asynccontextmanager
+    async def _open_stream(self, url: str) -> AsyncIterator[httpx.Response]:
+        """
+        Open a streaming GET, raising the mapped API error for error statuses.
+        """
+        async with self.client.stream("GET", url) as r:
+            if r.status_code >= 400:
+                body = await r.aread()
+                resp = httpx.Response(
+                    status_code=r.status_code,
+                    headers=r.headers,
+                    content=body,
+                    request=r.request,
+                )
+                self._handle_error_response(resp)
+            yield r
+
+    def _body_chunks(
+        self, response: httpx.Response, chunk_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Iterate a streamed response body, skipping the decoder when possible.
+        """
+        # Without a Content-Encoding the raw bytes are the body; skip the decoder
+        # (unless the body was already read into memory, e.g. by a transport)
+        identity = response.headers.get("Content-Encoding", "identity") == "identity"
+        if identity and not response.is_stream_consumed:
+            return response.aiter_raw(chunk_size)
+        return response.aiter_bytes(chunk_size)
+
+    async def _write_stream(
+        self, response: httpx.Response, dest: Path, chunk_size: Optional[int] = None
+    ) -> None:
+        """
+        Write a streamed response body to dest with unbuffered os.write calls.
+        Skips Python's file buffer (an extra copy per chunk) and, when the final
+        size is known, preallocates the file up front. Writes run off the event
+        loop, overlapping disk I/O with receiving the next chunk.
+        """
+        identity = response.headers.get("Content-Encoding", "identity") == "identity"
+        chunks = self._body_chunks(response, chunk_size)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(dest, flags, 0o644)
+        try:
+            length = response.headers.get("Content-Length", "")
+            if identity and length.isdigit() and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(fd, 0, int(length))
+                except OSError:
+                    pass  # Preallocation is only an optimization
+            # Each chunk is written on a worker thread while the next one is
+            # received; awaiting the previous write first keeps them in order
+            written = 0
+            pending: Optional[asyncio.Task[int]] = None
+            try:
+                async for chunk in chunks:
+                    if pending is not None:
+                        written += await pending
+                    pending = asyncio.create_task(
+                        asyncio.to_thread(_write_all, fd, chunk)
+                    )
+                if pending is not None:
+                    written += await pending
+            finally:
+                # Never close fd under a write still running on the thread
+                if pending is not None and not pending.done():
+                    await asyncio.wait([pending])
+            # Drop any preallocated tail if the body came up short
+            os.ftruncate(fd, written)
+        finally:
+            os.close(fd)
 
     def _infer_extension_from_content_type(
         self, content_type: Optional[str]
@@ -516,43 +842,25 @@ class NapkinAPIClient:
         """
         if not cd:
             return None
-        try:
-            # naive parse; sufficient for common cases
-            parts = [p.strip() for p in cd.split(";")]
-            filename_star = next(
-                (
-                    p.split("=", 1)[1]
-                    for p in parts
-                    if p.lower().startswith("filename*=")
-                ),
-                None,
-            )
-            if filename_star:
-                # format: filename*=UTF-8''encoded-name
-                val = filename_star.strip()
-                if val.lower().startswith("utf-8''"):
-                    import urllib.parse
-
-                    return urllib.parse.unquote(val[7:])
-                # generic fallback without encoding marker
-                return val.strip('"').strip("'")
-            filename = next(
-                (
-                    p.split("=", 1)[1]
-                    for p in parts
-                    if p.lower().startswith("filename=")
-                ),
-                None,
-            )
-            if filename:
-                return filename.strip('"').strip("'")
-        except Exception:
-            return None
-        return None
+        filename = None
+        for m in _CD_FILENAME_RE.finditer(cd):
+            if m.group("charset") is not None:
+                try:
+                    value = urllib.parse.unquote(
+                        m.group("encoded"), encoding=m.group("charset")
+                    )
+                except LookupError:
+                    value = urllib.parse.unquote(m.group("encoded"))
+            elif m.group("quoted") is not None:
+                value = _CD_ESCAPE_RE.sub(r"\1", m.group("quoted"))
+            else:
+                value = m.group("token").strip().strip('"').strip("'")
+            if m.group("star"):
+                return value or filename
+            filename = filename or value
+        return filename or None
 
     def _get_int_env(self, key: str, default: int) -> int:
-        import os
-
         try:
             val = os.getenv(key)
             return int(val) if val is not None else default
@@ -560,8 +868,6 @@ class NapkinAPIClient:
             return default
 
     def _get_bool_env(self, key: str, default: bool) -> bool:
-        import os
-
         val = os.getenv(key)
         if val is None:
             return default
@@ -572,24 +878,28 @@ class NapkinAPIClient:
         Download a generated file by its file ID using the API's file endpoint.
         Returns raw bytes.
         """
-        endpoint = API_ENDPOINTS["get_file"].format(
-            request_id=request_id,
-            file_id=file_id,
+        response = await self._make_request(
+            "GET", self._file_tmpl % (request_id, file_id)
         )
-        response = await self._make_request("GET", endpoint)
         return response.content
 
-    async def download_file_by_url(self, url: str) -> bytes:
+    async def download_file_by_url(self, url: str, hasher: Any = None) -> bytes:
         """
         Download a generated file directly from a provided URL.
-        Returns raw bytes. Uses binary-safe buffering.
+        Returns raw bytes, accumulated chunk by chunk from the stream.
+
+        Args:
+            url: File URL.
+            hasher: Optional hash object (e.g. hashlib.sha256()) updated with
+                each chunk, so checksums need no second pass over the bytes.
         """
-        # Use the underlying AsyncClient to leverage shared settings
-        resp = await self.client.get(url, headers=self.headers)
-        if resp.status_code >= 400:
-            self._handle_error_response(resp)
-        # Ensure bytes are returned without decoding; httpx already provides bytes
-        return resp.content
+        buf = bytearray()
+        async with self.iter_file(url) as chunks:
+            async for chunk in chunks:
+                buf += chunk
+                if hasher is not None:
+                    hasher.update(chunk)
+        return bytes(buf)
 
     async def wait_for_completion(
         self,
@@ -602,7 +912,8 @@ class NapkinAPIClient:
 
         Args:
             request_id: The request ID to monitor.
-            poll_interval: Seconds between polls (uses config default if None).
+            poll_interval: Minimum seconds between polls (uses config default if
+                None). Waits back off with jitter, up to 30 seconds.
             max_attempts: Maximum polling attempts (uses config default if None).
 
         Returns:
@@ -614,44 +925,68 @@ class NapkinAPIClient:
         poll_interval = poll_interval or self.settings.poll_interval_seconds
         max_attempts = max_attempts or self.settings.max_poll_attempts
 
+        loop = asyncio.get_running_loop()
         attempts = 0
         delay = poll_interval
+        # (timestamp, progress) of the last poll that reported progress
+        last_progress: Optional[tuple[float, float]] = None
 
-        while attempts < max_attempts:
-            # Check status
-            status = await self.get_status(request_id)
+        try:
+            while attempts < max_attempts:
+                # Check status
+                status = await self.get_status(request_id)
 
-            # Log detailed status
-            logger.debug(
-                f"Polling attempt {attempts + 1}: status={status.status.value}, files_ready={status.files_ready}"
-            )
+                # Log detailed status
+                logger.debug(
+                    f"Polling attempt {attempts + 1}: status={status.status.value}, files_ready={status.files_ready}"
+                )
 
-            # Check if terminal state
-            if status.status in {
-                RequestStatus.COMPLETED,
-                RequestStatus.FAILED,
-                RequestStatus.EXPIRED,
-            }:
-                if status.status == RequestStatus.FAILED:
-                    raise ProcessingError(
-                        f"Visual generation failed: {status.error or 'Unknown error'}"
+                # Check if terminal state
+                if status.status in TERMINAL_STATUSES:
+                    if status.status == RequestStatus.FAILED:
+                        raise ProcessingError(
+                            f"Visual generation failed: {status.error or 'Unknown error'}"
+                        )
+                    elif status.status == RequestStatus.EXPIRED:
+                        raise ProcessingError("Request expired")
+                    return status
+
+                # Log progress
+                if status.progress:
+                    logger.info(
+                        f"Progress: {status.progress:.0f}% - {status.message or ''}"
                     )
-                elif status.status == RequestStatus.EXPIRED:
-                    raise ProcessingError("Request expired")
-                return status
-
-            # Log progress
-            if status.progress:
-                logger.info(
-                    f"Progress: {status.progress:.0f}% - {status.message or ''}"
+
+                # Decorrelated-jitter backoff keeps concurrent pollers from
+                # hitting the API in lockstep
+                delay = min(random.uniform(poll_interval, delay * 3), 30)  # Cap at 30s
+
+                # Poll sooner if the observed progress rate says we're nearly done
+                now = loop.time()
+                if status.progress is not None:
+                    if last_progress and status.progress > last_progress[1]:
+                        rate = (status.progress - last_progress[1]) / (
+                            now - last_progress[0]
+                        )
+                        eta = (100 - status.progress) / rate
+                        delay = min(delay, max(eta, poll_interval))
+                    last_progress = (now, status.progress)
+
+                # Never poll again before the server says we may
+                retry_after = (
+                    self.rate_limit_info.retry_after if self.rate_limit_info else None
                 )
+                if retry_after:
+                    delay = max(delay, float(retry_after))
 
-            # Wait with exponential backoff
-            await asyncio.sleep(delay)
-            delay = min(delay * 1.2, 30)  # Cap at 30 seconds
-            attempts += 1
+                await asyncio.sleep(delay)
+                attempts += 1
 
-        raise ProcessingError(f"Timeout after {max_attempts} attempts")
+            raise ProcessingError(f"Timeout after {max_attempts} attempts")
+        finally:
+            # Polling is over (done, failed, timed out or cancelled); the
+            # revalidation entry is of no further use
+            self._status_cache.pop(request_id, None)
 
     def get_rate_limit_status(self) -> Optional[RateLimitInfo]:
         """
@@ -16,40 +16,74 @@ Model overview:
 - StatusResponse: lightweight progress/status view.
 - ErrorResponse: normalized error envelope with code/details and timestamp.
 - RateLimitInfo: rate limits from headers with helper properties.
+
+Response models parse raw JSON bodies with Model.from_json_bytes(response.content),
+which validates in one pass instead of json.loads(...) followed by Model(**data).
 """
 
-from datetime import datetime, timedelta
+import json
+import os
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Annotated, List, Optional, Dict, Any
+from types import SimpleNamespace
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import (
     BaseModel,
     Field,
     HttpUrl,
     StrictBool,
-    StrictFloat,
     StrictInt,
     StrictStr,
-    SecretStr,
-    field_validator,
+    TypeAdapter,
     model_validator,
 )
 
-# Common constrained aliases
+# msgspec is optional; it decodes status bodies straight into typed structs
+try:
+    import msgspec  # type: ignore
+
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Current time as an aware UTC datetime (datetime.utcnow is deprecated)."""
+    return datetime.now(_UTC)
+
+
+# Identifier/code patterns shared by the aliases and models below
+_ID_RE = r"^[A-Za-z0-9_\-]+$"
+_LANG_RE = r"^[A-Za-z]{2,3}(-[A-Za-z0-9]{2,8})*$"
+_CHECKSUM_RE = r"^[A-Fa-f0-9]+$"
+_CODE_RE = r"^[A-Z0-9_]+$"
+
+# Common constrained aliases. Request inputs are strict so bools, bytes and
+# numeric strings are rejected; response bodies are validated from JSON, where
+# strict and lax string validation coincide.
 NonEmptyStr = Annotated[StrictStr, Field(min_length=1)]
 ShortText = Annotated[StrictStr, Field(min_length=1, max_length=5000)]
 LongText = Annotated[StrictStr, Field(min_length=1, max_length=10000)]
-LangCode = Annotated[
-    StrictStr,
-    Field(min_length=2, max_length=35, pattern=r"^[A-Za-z]{2,3}(-[A-Za-z0-9]{2,8})*$"),
-]
-IdStr = Annotated[
-    StrictStr, Field(min_length=8, max_length=64, pattern=r"^[A-Za-z0-9_\-]+$")
-]
+LangCode = Annotated[StrictStr, Field(min_length=2, max_length=35, pattern=_LANG_RE)]
+IdStr = Annotated[StrictStr, Field(min_length=8, max_length=64, pattern=_ID_RE)]
 PositiveSmallInt = Annotated[StrictInt, Field(ge=1, le=4)]
 PngDim = Annotated[StrictInt, Field(ge=100, le=4096)]
-PercentFloat = Annotated[StrictFloat, Field(ge=0, le=100)]
-BytesCount = Annotated[StrictInt, Field(ge=0)]
+PercentFloat = Annotated[float, Field(ge=0, le=100)]
+BytesCount = Annotated[int, Field(ge=0)]
 
 
 class RequestStatus(str, Enum):
@@ -62,6 +96,12 @@ class RequestStatus(str, Enum):
     EXPIRED = "expired"
 
 
+# Statuses after which a request no longer changes
+TERMINAL_STATUSES: FrozenSet[RequestStatus] = frozenset(
+    {RequestStatus.COMPLETED, RequestStatus.FAILED, RequestStatus.EXPIRED}
+)
+
+
 class OutputFormat(str, Enum):
     """Supported output formats."""
 
@@ -69,6 +109,18 @@ class OutputFormat(str, Enum):
     PNG = "png"
 
 
+_ResponseT = TypeVar("_ResponseT", bound="_ResponseModel")
+
+
+class _ResponseModel(BaseModel):
+    """Base for models populated from API JSON bodies."""
+
+    @classmethod
+    def from_json_bytes(cls: Type[_ResponseT], data: Union[bytes, str]) -> _ResponseT:
+        """Parse and validate a JSON body without an intermediate dict."""
+        return cls.model_validate_json(data)
+
+
 class VisualRequest(BaseModel):
     """Request model for creating a visual.
 
@@ -155,59 +207,29 @@ class VisualRequest(BaseModel):
         max_length=20,
     )
 
-    # Optional sensitive token (example of redaction)
-    api_token: Optional[SecretStr] = Field(
-        default=None,
-        description="Optional bearer token; excluded from serialized output.",
-        exclude=True,
-    )
-
-    @model_validator(mode="after")
-    def _validate_png_dimensions(self):
-        """Ensure width/height only set when format is PNG."""
-        if self.format != OutputFormat.PNG:
-            if self.width is not None or self.height is not None:
-                raise ValueError("width and height can only be set when format=png")
-        return self
-
-    @field_validator("visual_ids")
+    @model_validator(mode="before")
     @classmethod
-    def _validate_visual_ids(cls, v):
-        if v is not None and len(v) == 0:
-            raise ValueError("visual_ids must not be empty if provided")
-        return v
-
-    @field_validator("visual_queries")
-    @classmethod
-    def _validate_visual_queries(cls, v):
-        if v is not None and len(v) == 0:
-            raise ValueError("visual_queries must not be empty if provided")
-        return v
+    def _check_png_dims_early(cls, data: Any) -> Any:
+        """Ensure width/height only set when format is PNG.
+
+        Runs before field validation so such requests are rejected without
+        validating every field first.
+        """
+        if isinstance(data, dict):
+            fmt = data.get("format", OutputFormat.SVG)
+            width, height = data.get("width"), data.get("height")
+        else:
+            fmt = getattr(data, "format", OutputFormat.SVG)
+            width, height = getattr(data, "width", None), getattr(data, "height", None)
+        if fmt != OutputFormat.PNG and (width is not None or height is not None):
+            raise ValueError("width and height can only be set when format=png")
+        return data
 
     model_config = {
         "populate_by_name": True,
         "from_attributes": True,
         "ser_json_timedelta": "float",
         "ser_json_bytes": "base64",
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "content": "Machine Learning Pipeline",
-                    "format": "svg",
-                    "style_id": "CDQPRVVJCSTPRBBCD5Q6AWR",
-                    "language": "en-US",
-                    "number_of_visuals": 2,
-                },
-                {
-                    "content": "Data flow diagram",
-                    "format": "png",
-                    "width": 1024,
-                    "height": 768,
-                    "transparent_background": True,
-                    "inverted_color": False,
-                },
-            ]
-        },
     }
 
 
@@ -255,27 +277,17 @@ class GeneratedFile(BaseModel):
         description="Optional checksum (e.g., SHA256 hex).",
         min_length=32,
         max_length=128,
-        pattern=r"^[A-Fa-f0-9]+$",
+        pattern=_CHECKSUM_RE,
     )
 
     model_config = {
         "from_attributes": True,
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "426614174000-wdjvjhwv8",
-                    "url": "https://api.napkin.ai/v1/visual/123e4567-e89b-12d3-a456-426614174000/file/426614174000-wdjvjhwv8",
-                    "format": "svg",
-                    "filename": "visual.svg",
-                    "size_bytes": 245760,
-                    "created_at": "2025-01-01T12:00:00Z",
-                }
-            ]
-        },
+        # Immutable metadata: no per-assignment validation, and hashable
+        "frozen": True,
     }
 
 
-class VisualResponse(BaseModel):
+class VisualResponse(_ResponseModel):
     """Response model for visual creation request outcome."""
 
     request_id: IdStr = Field(
@@ -313,60 +325,29 @@ class VisualResponse(BaseModel):
     @property
     def is_completed(self) -> bool:
         """True if request reached COMPLETED state."""
-        return self.status == RequestStatus.COMPLETED
+        return self.status is RequestStatus.COMPLETED
 
     @property
     def is_failed(self) -> bool:
         """True if request reached FAILED state."""
-        return self.status == RequestStatus.FAILED
+        return self.status is RequestStatus.FAILED
 
     @property
     def is_expired(self) -> bool:
         """True if request reached EXPIRED state."""
-        return self.status == RequestStatus.EXPIRED
+        return self.status is RequestStatus.EXPIRED
 
     @property
     def is_terminal(self) -> bool:
         """True if request is in a terminal state (completed/failed/expired)."""
-        return self.status in {
-            RequestStatus.COMPLETED,
-            RequestStatus.FAILED,
-            RequestStatus.EXPIRED,
-        }
+        return self.status in TERMINAL_STATUSES
 
     model_config = {
         "from_attributes": True,
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "request_id": "REQ_abcd1234",
-                    "status": "processing",
-                    "created_at": "2025-01-01T12:00:00Z",
-                    "updated_at": "2025-01-01T12:00:10Z",
-                    "files": [],
-                },
-                {
-                    "request_id": "REQ_abcd1234",
-                    "status": "completed",
-                    "created_at": "2025-01-01T12:00:00Z",
-                    "updated_at": "2025-01-01T12:00:30Z",
-                    "files": [
-                        {
-                            "id": "FILE_abc123",
-                            "url": "https://cdn.example.com/files/FILE_abc123.png",
-                            "format": "png",
-                            "width": 1024,
-                            "height": 768,
-                            "size_bytes": 345678,
-                        }
-                    ],
-                },
-            ]
-        },
     }
 
 
-class StatusResponse(BaseModel):
+class StatusResponse(_ResponseModel):
     """Lightweight response for status polling and progress reporting."""
 
     request_id: IdStr = Field(
@@ -420,22 +401,10 @@ class StatusResponse(BaseModel):
     model_config = {
         "from_attributes": True,
         "ser_json_timedelta": "iso8601",
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "request_id": "REQ_abcd1234",
-                    "status": "processing",
-                    "progress": 42.5,
-                    "message": "Rendering variants...",
-                    "files_ready": 1,
-                    "files_total": 3,
-                }
-            ]
-        },
     }
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(_ResponseModel):
     """Normalized API error response envelope."""
 
     error: NonEmptyStr = Field(
@@ -444,9 +413,7 @@ class ErrorResponse(BaseModel):
         examples=["Invalid width for PNG format"],
     )
     code: Optional[
-        Annotated[
-            StrictStr, Field(min_length=2, max_length=64, pattern=r"^[A-Z0-9_]+$")
-        ]
+        Annotated[StrictStr, Field(min_length=2, max_length=64, pattern=_CODE_RE)]
     ] = Field(
         default=None,
         description="Machine-readable error code (e.g., VALIDATION_ERROR).",
@@ -461,26 +428,16 @@ class ErrorResponse(BaseModel):
         description="Request ID if available for correlation.",
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="Error timestamp (UTC).",
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "error": "width and height can only be set when format=png",
-                    "code": "VALIDATION_ERROR",
-                    "details": {"field": "width"},
-                    "request_id": "REQ_abcd1234",
-                    "timestamp": "2025-01-01T12:00:30Z",
-                }
-            ]
-        }
-    }
+
+# Latest reset time datetime can represent (9999-12-31T23:59:59Z)
+MAX_RESET_EPOCH = 253402300799
 
 
-class RateLimitInfo(BaseModel):
+class RateLimitInfo(_ResponseModel):
     """Rate limit information derived from response headers."""
 
     limit: BytesCount = Field(
@@ -491,15 +448,20 @@ class RateLimitInfo(BaseModel):
         ...,
         description="Remaining requests in current window (>=0).",
     )
-    reset: datetime = Field(
+    reset_epoch: Annotated[int, Field(ge=0, le=MAX_RESET_EPOCH)] = Field(
         ...,
-        description="When the rate limit window resets (UTC).",
+        description="When the rate limit window resets (Unix epoch seconds).",
     )
     retry_after: Optional[Annotated[StrictInt, Field(ge=0)]] = Field(
         default=None,
         description="Seconds to wait before retrying (>=0).",
     )
 
+    @property
+    def reset(self) -> datetime:
+        """When the rate limit window resets, as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.reset_epoch, tz=_UTC)
+
     @property
     def is_exceeded(self) -> bool:
         """True when no remaining requests are available."""
@@ -507,23 +469,86 @@ class RateLimitInfo(BaseModel):
 
     model_config = {
         "from_attributes": True,
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "limit": 60,
-                    "remaining": 0,
-                    "reset": "2025-01-01T12:01:00Z",
-                    "retry_after": 30,
-                }
-            ]
-        },
+        # A fresh instance is built per response; never mutated in place
+        "frozen": True,
     }
 
 
+# Validator for lists of file metadata, built once. Models carry their own
+# cached validators, but each TypeAdapter(...) builds a new one, so reuse this
+# instead of constructing TypeAdapter(List[GeneratedFile]) per response.
+GENERATED_FILE_LIST_ADAPTER: TypeAdapter[List[GeneratedFile]] = TypeAdapter(
+    List[GeneratedFile]
+)
+
+# Defaults for fields a status poll body may omit
+_STATUS_BODY_DEFAULTS: Dict[str, Any] = {
+    "progress": None,
+    "message": None,
+    "files_ready": 0,
+    "files_total": 0,
+    "error": None,
+    "generated_files": None,
+    "files": None,
+    "urls": None,
+}
+
+if HAS_MSGSPEC:
+
+    class _FastStatusBody(msgspec.Struct):
+        """Wire shape of a status poll body, decoded without an interim dict."""
+
+        status: str
+        progress: Optional[float] = None
+        message: Optional[str] = None
+        files_ready: int = 0
+        files_total: int = 0
+        error: Optional[str] = None
+        generated_files: Optional[List[Dict[str, Any]]] = None
+        files: Optional[List[Dict[str, Any]]] = None
+        urls: Optional[List[str]] = None
+
+    _decode_fast_status = msgspec.json.Decoder(_FastStatusBody).decode
+
+
+def decode_status_body(data: bytes, loads: Callable[[bytes], Any] = json.loads) -> Any:
+    """
+    Decode a raw status poll body into an object with attribute access.
+
+    Uses msgspec when installed; bodies it cannot type (e.g. a numeric field
+    sent as a string) and installs without it fall back to loads. The result
+    carries the wire fields (status, progress, message, files_ready,
+    files_total, error, generated_files, files, urls), not a validated
+    StatusResponse.
+    """
+    if HAS_MSGSPEC:
+        try:
+            return _decode_fast_status(data)
+        except msgspec.DecodeError:
+            pass
+    return SimpleNamespace(**{**_STATUS_BODY_DEFAULTS, **loads(data)})
+
+
+# Schema examples are documentation only; load them on request (e.g. when
+# generating OpenAPI docs) rather than on every import
+if os.environ.get("NAPKIN_ENABLE_OPENAPI_EXAMPLES"):
+    from ._examples import attach_examples
+
+    attach_examples(
+        VisualRequest,
+        GeneratedFile,
+        VisualResponse,
+        StatusResponse,
+        ErrorResponse,
+        RateLimitInfo,
+    )
+
+
 # Usage examples (unit-test–friendly):
 # Validate VisualRequest
 # VisualRequest(content="Diagram", format="png", width=512, height=512)
 # ErrorResponse(error="Bad input", code="VALIDATION_ERROR")
+# GENERATED_FILE_LIST_ADAPTER.validate_python([{"id": "FILE_abc123", "format": "svg"}])
 
 # TODO: Clarify if request_id, file id formats should be UUIDs rather than custom strings.
 # TODO: Confirm maximum list sizes for visual_ids and visual_queries (assumed 20).
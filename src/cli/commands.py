@@ -5,24 +5,22 @@ Provides command-line interface for generating visuals using the Napkin API.
 """
 
 import asyncio
+import atexit
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Coroutine, Optional, TypeVar
 
 import typer
-from rich.console import Console
 from rich.logging import RichHandler
 
-from ..core.generator import generate_visual
 from ..utils.config import get_settings
-from ..utils.constants import STYLES
-from ..api.client import NapkinAPIError, AuthenticationError, RateLimitError
 from .display import (
+    console,
     display_error,
     display_success,
     display_info,
     display_visual_result,
-    create_progress,
+    FastSpinner,
 )
 
 
@@ -34,8 +32,41 @@ app = typer.Typer(
     add_completion=True,
 )
 
-# Console for rich output
-console = Console()
+T = TypeVar("T")
+
+# Event loop reused by every command run in this process
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the process-wide event loop.
+
+    Unlike asyncio.run, the loop (and connections kept on it) survives between
+    calls, which helps drivers that invoke commands repeatedly in-process.
+    """
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+        atexit.register(_shutdown_loop, _LOOP)
+    return _LOOP.run_until_complete(coro)
+
+
+def _shutdown_loop(loop: asyncio.AbstractEventLoop):
+    """Release what the process-wide loop still holds, then close it."""
+    if loop.is_closed():
+        return
+    # Only commands that make API calls create the loop, so the client module
+    # is already loaded by the time this runs
+    from ..api.client import NapkinAPIClient
+
+    try:
+        loop.run_until_complete(NapkinAPIClient.aclose_shared())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
 
 
 def setup_logging(level: str = "INFO"):
@@ -44,6 +75,8 @@ def setup_logging(level: str = "INFO"):
         level=level,
         format="%(message)s",
         handlers=[
+            # Log through the display console so records are printed above
+            # an active spinner instead of into its line
             RichHandler(
                 console=console,
                 rich_tracebacks=True,
@@ -141,6 +174,11 @@ def generate(
         napkin generate "Data Flow" --style sketch-notes --format png
         napkin generate "Architecture" -s corporate-clean -n 3 -o ./output
     """
+    # Imported here so --help, styles, config and version skip loading the
+    # HTTP client stack
+    from ..api.client import AuthenticationError, NapkinAPIError, RateLimitError
+    from ..core.generator import generate_visual
+
     # Setup logging
     setup_logging("DEBUG" if debug else "INFO")
 
@@ -163,17 +201,16 @@ def generate(
             f"with style '{style_name}'"
         )
 
-        # Create progress spinner
-        with create_progress() as progress:
-            task = progress.add_task(
-                "[cyan]Creating visual...",
-                total=None,
-            )
+        # Share one HTTP client (and its open connections) across every
+        # generate call made on the process-wide loop
+        shared_settings = settings.model_copy(update={"share_client": True})
 
-            # Run async generation
-            status, file_paths = asyncio.run(
-                generate_visual(
+        async def run_generation():
+            """Run the generation behind a spinner on the same event loop."""
+            async with FastSpinner("[cyan]Creating visual..."):
+                return await generate_visual(
                     content=content,
+                    settings=shared_settings,
                     style=style,
                     format=format,
                     output_dir=output,
@@ -186,9 +223,9 @@ def generate(
                     width=width,
                     height=height,
                 )
-            )
 
-            progress.update(task, completed=True)
+        # Run async generation
+        status, file_paths = _run_async(run_generation())
 
         # Display results
         if file_paths:
@@ -240,7 +277,7 @@ def styles(
         napkin styles --list
         napkin styles --category colorful
     """
-    from ..utils.constants import StyleCategory, get_styles_by_category
+    from ..utils.constants import STYLES, StyleCategory, get_styles_by_category
     from rich.table import Table
 
     # Create table for displaying styles
@@ -265,7 +302,7 @@ def styles(
             )
             raise typer.Exit(1)
     else:
-        styles_to_show = list(STYLES.values())
+        styles_to_show = tuple(STYLES.values())
 
     # Add styles to table
     for style in styles_to_show:
@@ -4,20 +4,68 @@ Rich terminal output and display utilities for CLI.
 Provides formatted console output using Rich library for better user experience.
 """
 
+import asyncio
+import json
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, List, Optional, Tuple
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.spinner import Spinner
 from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
+# orjson is optional; it serializes several times faster than json
+try:
+    import orjson  # type: ignore
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # Create console instance
 console = Console()
 
+# Column definitions shared by every table built in this module
+_RESULT_COLUMNS = (
+    ("#", "dim"),
+    ("Filename", "green"),
+    ("Path", "white"),
+    ("Size", "yellow"),
+)
+_SIZE_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024 * 1024))
+_SUMMARY_COLUMNS = (("Parameter", "cyan"), ("Value", "white"))
+
+# (label, kwarg, formatter) for summary rows shown only when the kwarg is set
+_OPTIONAL_SUMMARY_ROWS: Tuple[Tuple[str, str, Callable[[Any], str]], ...] = (
+    ("Language", "language", str),
+    ("Width", "width", "{}px".format),
+    ("Height", "height", "{}px".format),
+    ("Transparent", "transparent", lambda _: "Yes"),
+    ("Inverted", "inverted", lambda _: "Yes"),
+)
+
+# Progress columns hold no per-run state, so one set serves every spinner
+_PROGRESS_COLUMNS = (
+    SpinnerColumn(),
+    TextColumn("[progress.description]{task.description}"),
+)
+
+# Terminal width is re-queried at most once per TTL window
+_WIDTH_TTL_SECONDS = 1.0
+_cached_width: Tuple[float, int] = (0.0, 0)
+
+_STYLE_PREVIEW_TEMPLATE = (
+    "[bold cyan]{name}[/bold cyan]\n[dim]ID: {style_id}[/dim]\n\n{description}"
+)
+
 
 def display_error(message: str):
     """Display error message in red."""
@@ -55,24 +103,13 @@ def display_visual_result(file_paths: List[Path]):
         show_header=True,
         header_style="bold cyan",
     )
-    table.add_column("#", style="dim")
-    table.add_column("Filename", style="green")
-    table.add_column("Path", style="white")
-    table.add_column("Size", style="yellow")
-
-    for i, path in enumerate(file_paths, 1):
-        # Get file size
-        if path.exists():
-            size = path.stat().st_size
-            if size < 1024:
-                size_str = f"{size} B"
-            elif size < 1024 * 1024:
-                size_str = f"{size / 1024:.1f} KB"
-            else:
-                size_str = f"{size / (1024 * 1024):.1f} MB"
-        else:
-            size_str = "N/A"
+    for header, column_style in _RESULT_COLUMNS:
+        table.add_column(header, style=column_style)
+
+    # Stat every file up front so the row loop only assembles strings
+    sizes = [_format_size(path) for path in file_paths]
 
+    for i, (path, size_str) in enumerate(zip(file_paths, sizes), 1):
         table.add_row(
             str(i),
             path.name,
@@ -80,9 +117,31 @@ def display_visual_result(file_paths: List[Path]):
             size_str,
         )
 
-    console.print("\n")
-    console.print(table)
-    console.print()
+    # One print for the table and its surrounding blank lines
+    console.print(Group("\n", table, ""))
+
+
+def _format_size(path: Path) -> str:
+    """
+    Format a file's size with a single stat call.
+
+    Args:
+        path: File to measure.
+
+    Returns:
+        Size string such as "12.3 KB", or "N/A" if the file cannot be read.
+    """
+    try:
+        size = os.stat(path).st_size
+    except OSError:
+        return "N/A"
+
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    index = min(len(_SIZE_UNITS) - 1, max(size.bit_length() - 1, 0) // 10)
+    if index == 0:
+        return f"{size} B"
+    unit, divisor = _SIZE_UNITS[index]
+    return f"{size / divisor:.1f} {unit}"
 
 
 def create_progress() -> Progress:
@@ -93,13 +152,78 @@ def create_progress() -> Progress:
         Progress instance with spinner.
     """
     return Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
+        *_PROGRESS_COLUMNS,
         console=console,
         transient=True,
     )
 
 
+class FastSpinner:
+    """
+    Lightweight spinner for a single long-running async operation.
+
+    The spinner is a transient Live region on the shared console, so log
+    records and other console output are printed above it instead of being
+    mixed into its frames. Frames are refreshed from a task on the running
+    loop rather than by Live's background refresh thread.
+
+    Usage:
+        async with FastSpinner("[cyan]Creating visual..."):
+            await work()
+    """
+
+    def __init__(self, description: str, interval: float = 0.1):
+        """
+        Initialize the spinner.
+
+        Args:
+            description: Text (may contain markup) shown after the spinner.
+            interval: Seconds between frames.
+        """
+        self._live = Live(
+            Spinner("dots", text=description),
+            console=console,
+            transient=True,
+            auto_refresh=False,
+        )
+        self._interval = interval
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def __aenter__(self):
+        """Start the live region and the refresh task."""
+        self._live.start()
+        self._task = asyncio.create_task(self._spin())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Stop refreshing and remove the spinner line."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._live.stop()
+
+    async def _spin(self) -> None:
+        """Redraw the spinner once per interval until cancelled."""
+        while True:
+            self._live.refresh()
+            await asyncio.sleep(self._interval)
+
+
+def _json_pretty(data: Any) -> str:
+    """Serialize data as 2-space indented JSON, stringifying unknown types."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; json handles those
+    return json.dumps(data, indent=2, default=str)
+
+
 def display_api_response(data: dict, title: str = "API Response"):
     """
     Display API response data in formatted JSON.
@@ -108,10 +232,8 @@ def display_api_response(data: dict, title: str = "API Response"):
         data: Response data dictionary.
         title: Panel title.
     """
-    import json
-
     # Format JSON with syntax highlighting
-    json_str = json.dumps(data, indent=2, default=str)
+    json_str = _json_pretty(data)
     syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
 
     # Display in panel
@@ -128,12 +250,9 @@ def display_style_preview(style_name: str, style_id: str, description: str):
         style_id: Style ID.
         description: Style description.
     """
-    content = f"""
-[bold cyan]{style_name}[/bold cyan]
-[dim]ID: {style_id}[/dim]
-
-{description}
-    """
+    content = _STYLE_PREVIEW_TEMPLATE.format(
+        name=style_name, style_id=style_id, description=description
+    )
 
     panel = Panel(
         content.strip(),
@@ -173,8 +292,8 @@ def display_generation_summary(
         show_header=False,
         box=None,
     )
-    table.add_column("Parameter", style="cyan")
-    table.add_column("Value", style="white")
+    for header, column_style in _SUMMARY_COLUMNS:
+        table.add_column(header, style=column_style)
 
     # Add parameters
     table.add_row("Content", display_content)
@@ -183,19 +302,13 @@ def display_generation_summary(
     table.add_row("Variations", str(variations))
 
     # Add optional parameters
-    if kwargs.get("language"):
-        table.add_row("Language", kwargs["language"])
-    if kwargs.get("width"):
-        table.add_row("Width", f"{kwargs['width']}px")
-    if kwargs.get("height"):
-        table.add_row("Height", f"{kwargs['height']}px")
-    if kwargs.get("transparent"):
-        table.add_row("Transparent", "Yes")
-    if kwargs.get("inverted"):
-        table.add_row("Inverted", "Yes")
+    for label, key, formatter in _OPTIONAL_SUMMARY_ROWS:
+        value = kwargs.get(key)
+        if value:
+            table.add_row(label, formatter(value))
 
-    console.print(table)
-    console.print()
+    # One print for the table and its trailing blank line
+    console.print(Group(table, ""))
 
 
 def display_batch_progress(current: int, total: int, successful: int, failed: int):
@@ -260,5 +373,22 @@ def print_divider(char: str = "─", style: str = "dim"):
         char: Character to use for divider.
         style: Rich style for the divider.
     """
-    width = console.width
-    console.print(char * width, style=style)
+    console.print(_divider_text(char, style, _console_width()))
+
+
+def _console_width() -> int:
+    """Return the console width, refreshed at most once per TTL window."""
+    global _cached_width
+
+    now = time.monotonic()
+    expires_at, width = _cached_width
+    if now >= expires_at:
+        width = console.width
+        _cached_width = (now + _WIDTH_TTL_SECONDS, width)
+    return width
+
+
+@lru_cache(maxsize=4)
+def _divider_text(char: str, style: str, width: int) -> Text:
+    """Build the divider line for a given width; styling is applied on print."""
+    return Text(char * width, style=style, no_wrap=True, overflow="crop")
@@ -7,18 +7,118 @@ handling the complete workflow from request to downloaded files.
 
 import asyncio
 import logging
+import shutil
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Set, Tuple
 
 from ..api.client import NapkinAPIClient, ProcessingError
 from ..api.models import VisualRequest, StatusResponse, OutputFormat
 from ..utils.config import Settings, get_settings
-from ..utils.constants import get_style_by_name
+from ..utils.constants import STYLES
 
 
 logger = logging.getLogger(__name__)
 
+# Style IDs keyed by slug and by lowercased display name, as get_style_by_name
+# matches them
+_STYLE_IDS_BY_NAME: Dict[str, str] = {
+    **{style.name.lower(): style.id for style in STYLES.values()},
+    **{slug: style.id for slug, style in STYLES.items()},
+}
+
+
+# (status, saved paths) of one batch item; status is None if it failed
+_ItemResult = Tuple[Optional[StatusResponse], List[Path]]
+
+# File extensions the API can produce
+_FILE_EXTENSIONS = frozenset({"svg", "png"})
+
+# (epoch second, formatted timestamp) of the last filename generated
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
+def _filename_timestamp() -> str:
+    """Return the current UTC time as YYYYmmdd_HHMMSS, formatted once per second."""
+    global _timestamp_cache
+
+    second = int(time.time())
+    cached_second, formatted = _timestamp_cache
+    if second != cached_second:
+        formatted = datetime.fromtimestamp(second, timezone.utc).strftime(
+            "%Y%m%d_%H%M%S"
+        )
+        _timestamp_cache = (second, formatted)
+    return formatted
+
+
+def _unique_path(path: Path, taken: Set[Path]) -> Path:
+    """
+    Pick a path no earlier download in the same plan writes to.
+
+    Args:
+        path: Preferred path.
+        taken: Paths already planned; the returned path is added to it.
+
+    Returns:
+        path itself, or path with a _2, _3, ... suffix if it is taken.
+    """
+    candidate = path
+    n = 2
+    while candidate in taken:
+        candidate = path.with_name(f"{path.stem}_{n}{path.suffix}")
+        n += 1
+    taken.add(candidate)
+    return candidate
+
+
+def _copy_files(paths: List[Path], dest_dir: Optional[Path], index: int) -> List[Path]:
+    """
+    Copy a duplicate batch item's files from the item that generated them.
+
+    Args:
+        paths: Files saved for the original item.
+        dest_dir: Directory for the duplicate (the source's own if None).
+        index: Zero-based batch index of the duplicate, used to rename copies
+            that would otherwise overwrite an existing file.
+
+    Returns:
+        Paths of the copies.
+    """
+    copies = []
+    for path in paths:
+        target_dir = dest_dir or path.parent
+        target_dir.mkdir(parents=True, exist_ok=True)
+        dest = target_dir / path.name
+        if dest.exists():
+            dest = dest.with_name(f"{path.stem}_{index + 1:03d}{path.suffix}")
+        shutil.copyfile(path, dest)
+        copies.append(dest)
+    return copies
+
+
+@lru_cache(maxsize=128)
+def _resolve_style_id(style: Optional[str], default_style: str) -> str:
+    """
+    Resolve a style name, slug or raw ID to the API style ID.
+
+    Args:
+        style: Requested style; falls back to default_style when empty.
+        default_style: Configured default style.
+
+    Returns:
+        The known style's ID, or the input itself as a custom style ID.
+    """
+    name = style or default_style
+    key = name.strip().lower()
+    return (
+        _STYLE_IDS_BY_NAME.get(key.replace(" ", "-"))
+        or _STYLE_IDS_BY_NAME.get(key)
+        or name
+    )
+
 
 class VisualGenerator:
     """High-level interface for visual generation."""
@@ -93,22 +193,7 @@ class VisualGenerator:
             format_enum = OutputFormat.SVG  # Default to SVG if invalid
 
         # Handle style - could be name or ID
-        style_id = None
-        if style:
-            # Check if it's a known style name
-            try:
-                style_obj = get_style_by_name(style)
-                style_id = style_obj.id
-            except ValueError:
-                # Assume it's a custom style ID
-                style_id = style
-        else:
-            # Use default style
-            try:
-                style_obj = get_style_by_name(self.settings.default_style)
-                style_id = style_obj.id
-            except ValueError:
-                style_id = self.settings.default_style
+        style_id = _resolve_style_id(style, self.settings.default_style)
 
         # Create request
         return VisualRequest(
@@ -149,7 +234,7 @@ class VisualGenerator:
             Generated filename.
         """
         # Use timezone-aware UTC and consistent filename pattern
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        timestamp = _filename_timestamp()
         if index > 0:
             return f"napkin_{timestamp}_{request_id[:8]}_v{index + 1}.{format}"
         return f"napkin_{timestamp}_{request_id[:8]}.{format}"
@@ -248,20 +333,26 @@ class VisualGenerator:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Get files from status response (normalized by client.get_status)
-            files = getattr(final_status, "files", []) or []
+            # The terminal poll already carries the file list (normalized by
+            # client.get_status), so no further metadata request is needed
+            files = final_status.files or []
 
             def _infer_ext(fmt: Optional[str], url: Optional[str]) -> str:
-                if fmt in {"svg", "png"}:
+                if fmt in _FILE_EXTENSIONS:
                     return fmt
                 if url:
-                    if ".svg" in url.lower() or "image/svg" in url.lower():
-                        return "svg"
-                    if ".png" in url.lower():
-                        return "png"
+                    # Extension of the URL path, ignoring any query string
+                    ext = url.partition("?")[0].rpartition(".")[2].lower()
+                    if ext in _FILE_EXTENSIONS:
+                        return ext
                 # Fallback to requested format
                 return request.format.value if hasattr(request, "format") else "svg"
 
+            client = self.client
+
+            # Plan every download first, then run them concurrently
+            plan: List[Tuple[str, Path, Awaitable[object]]] = []
+            planned_paths: Set[Path] = set()
             if files:
                 for i, file_info in enumerate(files):
                     # file_info may be dict with {id, url?, format?, filename?} or {"url": "..."} from urls mapping
@@ -273,28 +364,28 @@ class VisualGenerator:
                     filename = file_info.get("filename") or self._generate_filename(
                         request_id, file_id, file_fmt, i
                     )
-                    file_path = output_dir / filename
-
-                    try:
-                        if file_url:
-                            # Use client direct URL downloader for consistent headers/handling
-                            file_content = await self.client.download_file_by_url(
-                                file_url
+                    # Files may share a provided filename; concurrent writes to
+                    # one path would clobber each other
+                    file_path = _unique_path(output_dir / filename, planned_paths)
+
+                    if file_url:
+                        # Stream straight to disk rather than buffering the file
+                        plan.append(
+                            (
+                                file_id,
+                                file_path,
+                                client.stream_file_by_url(file_url, file_path),
                             )
-                            file_path.write_bytes(file_content)
-                            saved_paths.append(file_path)
-                            logger.info("Saved: %s", file_path)
-                        else:
-                            # Fall back to file ID endpoint
-                            await self.client.download_file(
-                                request_id,
+                        )
+                    else:
+                        # Fall back to file ID endpoint
+                        plan.append(
+                            (
                                 file_id,
                                 file_path,
+                                client.download_file(request_id, file_id, file_path),
                             )
-                            saved_paths.append(file_path)
-                            logger.info("Saved: %s", file_path)
-                    except Exception as e:
-                        logger.error("Failed to download file %s: %s", file_id, e)
+                        )
             else:
                 # Fallback path when API doesn't return file metadata; try sequential IDs
                 for i in range(final_status.files_ready):
@@ -303,20 +394,29 @@ class VisualGenerator:
                         request_id, file_id, request.format.value, i
                     )
                     file_path = output_dir / filename
-                    try:
-                        await self.client.download_file(
-                            request_id,
+                    plan.append(
+                        (
                             file_id,
                             file_path,
+                            client.download_file(request_id, file_id, file_path),
                         )
-                        saved_paths.append(file_path)
-                        logger.info("Saved: %s", file_path)
-                    except Exception as e:
-                        logger.error("Failed to download file %s: %s", file_id, e)
+                    )
+
+            results = await asyncio.gather(
+                *(download for _, _, download in plan), return_exceptions=True
+            )
+            for (file_id, file_path, _), result in zip(plan, results):
+                if isinstance(result, Exception):
+                    logger.error("Failed to download file %s: %s", file_id, result)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    saved_paths.append(file_path)
+                    logger.info("Saved: %s", file_path)
 
         return final_status, saved_paths
 
-    async def generate_batch(
+    async def iter_batch(
         self,
         contents: List[str],
         output_dir: Optional[Path] = None,
@@ -324,9 +424,12 @@ class VisualGenerator:
         format: Optional[str] = None,
         concurrent_limit: Optional[int] = None,
         **kwargs,
-    ) -> List[Tuple[str, StatusResponse, List[Path]]]:
+    ) -> AsyncIterator[Tuple[int, str, Optional[StatusResponse], List[Path]]]:
         """
-        Generate visuals for multiple contents in batch.
+        Generate visuals for multiple contents, yielding each as it finishes.
+
+        A fixed pool of concurrent_limit workers pulls items from a queue, so
+        only that many generations are alive at any time.
 
         Args:
             contents: List of text contents.
@@ -336,39 +439,119 @@ class VisualGenerator:
             concurrent_limit: Max concurrent requests.
             **kwargs: Additional generation parameters.
 
-        Returns:
-            List of tuples (content, status, file_paths) for each generation.
+        Yields:
+            Tuples (index, content, status, file_paths) in completion order;
+            status is None if that item failed.
         """
+        if not contents:
+            return
         concurrent_limit = concurrent_limit or self.settings.batch_concurrent_limit
 
-        # Create semaphore for rate limiting
-        semaphore = asyncio.Semaphore(concurrent_limit)
+        pending: asyncio.Queue[Tuple[int, str]] = asyncio.Queue()
+        for item in enumerate(contents):
+            pending.put_nowait(item)
+        done: asyncio.Queue[Tuple[int, str, Optional[StatusResponse], List[Path]]] = (
+            asyncio.Queue()
+        )
 
-        async def generate_one(content: str, index: int):
-            """Generate visual for one content item."""
-            async with semaphore:
-                try:
-                    # Create subdirectory for batch item
-                    item_dir = None
-                    if output_dir:
-                        item_dir = output_dir / f"batch_{index + 1:03d}"
+        # Style, format and options are shared by the whole batch, so items
+        # with identical content are identical requests: the first one is
+        # generated and later ones wait for it and copy its files
+        shared: Dict[str, asyncio.Future[_ItemResult]] = {}
+        loop = asyncio.get_running_loop()
 
-                    status, paths = await self.generate(
+        async def worker() -> None:
+            """Generate queued items until the queue is empty."""
+            while True:
+                try:
+                    index, content = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                # Create subdirectory for batch item
+                item_dir = None
+                if output_dir:
+                    item_dir = output_dir / f"batch_{index + 1:03d}"
+
+                first = shared.get(content)
+                if first is not None:
+                    status, source_paths = await first
+                    try:
+                        paths = await asyncio.to_thread(
+                            _copy_files, source_paths, item_dir, index
+                        )
+                    except OSError as e:
+                        logger.error(f"Failed to copy files for item {index + 1}: {e}")
+                        paths = []
+                    done.put_nowait((index, content, status, paths))
+                    continue
+
+                future: asyncio.Future[_ItemResult] = loop.create_future()
+                shared[content] = future
+                result: _ItemResult = (None, [])
+                try:
+                    result = await self.generate(
                         content=content,
                         output_dir=item_dir,
                         style=style,
                         format=format,
                         **kwargs,
                     )
-                    return content, status, paths
                 except Exception as e:
                     logger.error(f"Failed to generate visual for item {index + 1}: {e}")
-                    return content, None, []
+                finally:
+                    future.set_result(result)
+                done.put_nowait((index, content, *result))
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(concurrent_limit, len(contents)))
+        ]
+        try:
+            for _ in range(len(contents)):
+                yield await done.get()
+        finally:
+            # Stop remaining work if the caller stops iterating early
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
-        # Generate all visuals concurrently
-        tasks = [generate_one(content, i) for i, content in enumerate(contents)]
+    async def generate_batch(
+        self,
+        contents: List[str],
+        output_dir: Optional[Path] = None,
+        style: Optional[str] = None,
+        format: Optional[str] = None,
+        concurrent_limit: Optional[int] = None,
+        **kwargs,
+    ) -> List[Tuple[str, Optional[StatusResponse], List[Path]]]:
+        """
+        Generate visuals for multiple contents in batch.
 
-        results = await asyncio.gather(*tasks)
+        Args:
+            contents: List of text contents.
+            output_dir: Directory to save files.
+            style: Style name or ID.
+            format: Output format.
+            concurrent_limit: Max concurrent requests.
+            **kwargs: Additional generation parameters.
+
+        Returns:
+            List of tuples (content, status, file_paths) for each generation,
+            in input order.
+        """
+        results: List[Tuple[str, Optional[StatusResponse], List[Path]]] = [
+            (content, None, []) for content in contents
+        ]
+        async for index, content, status, paths in self.iter_batch(
+            contents,
+            output_dir=output_dir,
+            style=style,
+            format=format,
+            concurrent_limit=concurrent_limit,
+            **kwargs,
+        ):
+            results[index] = (content, status, paths)
 
         # Log summary
         successful = sum(1 for _, status, _ in results if status)
@@ -384,6 +567,7 @@ async def generate_visual(
     output_dir: Optional[Path] = None,
     style: Optional[str] = None,
     format: Optional[str] = None,
+    settings: Optional[Settings] = None,
     **kwargs,
 ) -> Tuple[StatusResponse, List[Path]]:
     """
@@ -394,12 +578,13 @@ async def generate_visual(
         output_dir: Directory to save files.
         style: Style name or ID.
         format: Output format.
+        settings: Configuration settings. If None, loads from environment.
         **kwargs: Additional generation parameters.
 
     Returns:
         Tuple of (status, file_paths).
     """
-    async with VisualGenerator() as generator:
+    async with VisualGenerator(settings) as generator:
         return await generator.generate(
             content=content,
             output_dir=output_dir,
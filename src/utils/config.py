@@ -128,6 +128,29 @@ class Settings(BaseSettings):
         alias="NAPKIN_MAX_POLL_ATTEMPTS",
         gt=0,
     )
+    max_connections: int = Field(
+        default=100,
+        description="Maximum concurrent HTTP connections in the client pool",
+        alias="NAPKIN_MAX_CONNECTIONS",
+        gt=0,
+    )
+    max_keepalive_connections: int = Field(
+        default=50,
+        description="Maximum idle keep-alive connections kept in the pool",
+        alias="NAPKIN_MAX_KEEPALIVE_CONNECTIONS",
+        ge=0,
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        description="Seconds an idle keep-alive connection stays open",
+        alias="NAPKIN_KEEPALIVE_EXPIRY_SECONDS",
+        ge=0,
+    )
+    share_client: bool = Field(
+        default=False,
+        description="Share one HTTP connection pool across API client instances",
+        alias="NAPKIN_SHARE_CLIENT",
+    )
 
     # Application Settings
     log_level: str = Field(
@@ -249,6 +272,10 @@ class Settings(BaseSettings):
             "rate_limit_requests": str(self.rate_limit_requests),
             "poll_interval_seconds": str(self.poll_interval_seconds),
             "max_poll_attempts": str(self.max_poll_attempts),
+            "max_connections": str(self.max_connections),
+            "max_keepalive_connections": str(self.max_keepalive_connections),
+            "keepalive_expiry_seconds": str(self.keepalive_expiry_seconds),
+            "share_client": str(self.share_client),
             "log_level": self.log_level,
             "debug_mode": str(self.debug_mode),
             "batch_concurrent_limit": str(self.batch_concurrent_limit),
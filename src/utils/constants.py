@@ -15,7 +15,7 @@ Design goals:
 from __future__ import annotations
 
 from enum import Enum
-from typing import List, Mapping, NamedTuple
+from typing import List, Mapping, NamedTuple, Tuple
 
 
 class OutputFormat(str, Enum):
@@ -145,6 +145,12 @@ STYLES: Mapping[str, Style] = {
     ),
 }
 
+# Styles grouped by category, built once for O(1) category lookups
+_STYLES_BY_CATEGORY: Mapping[StyleCategory, Tuple[Style, ...]] = {
+    category: tuple(s for s in STYLES.values() if s.category == category)
+    for category in StyleCategory
+}
+
 
 # API Endpoints
 API_ENDPOINTS: Mapping[str, str] = {
@@ -190,6 +196,7 @@ RATE_LIMITS: Mapping[str, int] = {
 # HTTP Status codes
 HTTP_STATUS: Mapping[str, int] = {
     "created": 201,
+    "not_modified": 304,
     "bad_request": 400,
     "unauthorized": 401,
     "forbidden": 403,
@@ -248,7 +255,7 @@ def get_style_by_name(name: str) -> Style:
     raise ValueError(f"Style not found: {name!r}. Valid options: {valid}")
 
 
-def get_styles_by_category(category: StyleCategory) -> List[Style]:
+def get_styles_by_category(category: StyleCategory) -> Tuple[Style, ...]:
     """
     Get all styles in a category.
 
@@ -256,9 +263,9 @@ def get_styles_by_category(category: StyleCategory) -> List[Style]:
         category: The style category to filter by.
 
     Returns:
-        List of styles in the category.
+        Styles in the category, in definition order.
     """
-    return [style for style in STYLES.values() if style.category == category]
+    return _STYLES_BY_CATEGORY[category]
 
 
 def list_style_names() -> List[str]:
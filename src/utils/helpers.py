@@ -6,12 +6,16 @@ Provides common utilities for file handling, validation, and logging setup.
 
 import logging
 import os
-from datetime import datetime
+import re
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
 from rich.logging import RichHandler
 
+# Common language codes (e.g., "en", "en-US", "zh-Hans-CN")
+_LANGUAGE_CODE_RE = re.compile(r"^[a-z]{2,3}(-[A-Z][a-z]{3})?(-[A-Z]{2})?$")
+
 
 def setup_logging(
     level: str = "INFO",
@@ -174,11 +178,7 @@ def validate_language_code(code: str) -> bool:
     """
     # Basic validation for common formats
     # Full BCP 47 validation is complex, this covers common cases
-    import re
-
-    # Pattern for common language codes (e.g., "en", "en-US", "zh-Hans-CN")
-    pattern = r"^[a-z]{2,3}(-[A-Z][a-z]{3})?(-[A-Z]{2})?$"
-    return bool(re.match(pattern, code))
+    return bool(_LANGUAGE_CODE_RE.match(code))
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -210,7 +210,7 @@ def get_timestamp(format: str = "%Y%m%d_%H%M%S") -> str:
     Returns:
         Formatted timestamp.
     """
-    return datetime.utcnow().strftime(format)
+    return datetime.now(timezone.utc).strftime(format)
 
 
 def parse_csv_file(file_path: Path) -> list[dict]:
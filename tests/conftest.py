@@ -1 +1,50 @@
 # Pytest configuration and fixtures
+
+import asyncio
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.api.client import NapkinAPIClient
+from src.utils.config import Settings
+
+
+@pytest.fixture
+def make_settings():
+    """Factory building settings without the developer's environment or .env."""
+
+    def factory(**overrides) -> Settings:
+        env = {"NAPKIN_API_TOKEN": "test-token"}
+        env.update(overrides)
+        with patch.dict(os.environ, env, clear=True):
+            return Settings(_env_file=None)
+
+    return factory
+
+
+@pytest.fixture
+def mock_transport():
+    """
+    Route an API client's requests to a MockTransport handler.
+
+    The client built by the constructor is closed before it is replaced, and
+    the mock client is closed with the API client as usual.
+    """
+
+    async def install(api, handler, **client_kwargs):
+        await api.client.aclose()
+        api.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), **client_kwargs
+        )
+
+    return install
+
+
+@pytest.fixture
+def api(make_settings):
+    """API client for tests that make no requests; closed on teardown."""
+    client = NapkinAPIClient(make_settings())
+    yield client
+    asyncio.run(client.close())
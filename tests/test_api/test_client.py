@@ -0,0 +1,592 @@
+"""
+Tests for the API client.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from src.api import client as client_module
+from src.api.client import (
+    NapkinAPIClient,
+    NapkinAPIError,
+    ProcessingError,
+    RequestError,
+)
+from src.api.models import (
+    OutputFormat,
+    RateLimitInfo,
+    RequestStatus,
+    StatusResponse,
+    VisualRequest,
+)
+
+
+def make_status(status: RequestStatus, progress=None) -> StatusResponse:
+    return StatusResponse(request_id="request-123", status=status, progress=progress)
+
+
+class TestWaitForCompletion:
+    """Test status polling."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record requested sleeps instead of waiting."""
+        recorded = []
+
+        async def fake_sleep(delay):
+            recorded.append(delay)
+
+        monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+        return recorded
+
+    @pytest.mark.asyncio
+    async def test_backoff_stays_within_bounds(
+        self, monkeypatch, sleeps, make_settings
+    ):
+        """Test jittered delays never drop below the interval or exceed 30s."""
+        statuses = [make_status(RequestStatus.PROCESSING)] * 8
+        statuses.append(make_status(RequestStatus.COMPLETED))
+
+        async with NapkinAPIClient(make_settings()) as api:
+
+            async def fake_get_status(request_id):
+                return statuses.pop(0)
+
+            monkeypatch.setattr(api, "get_status", fake_get_status)
+            result = await api.wait_for_completion("request-123", poll_interval=2.0)
+
+        assert result.status == RequestStatus.COMPLETED
+        assert len(sleeps) == 8
+        assert all(2.0 <= delay <= 30 for delay in sleeps)
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self, monkeypatch, sleeps, make_settings):
+        """Test the next poll waits at least as long as Retry-After."""
+        statuses = [
+            make_status(RequestStatus.PROCESSING),
+            make_status(RequestStatus.COMPLETED),
+        ]
+
+        async with NapkinAPIClient(make_settings()) as api:
+
+            async def fake_get_status(request_id):
+                api.rate_limit_info = RateLimitInfo(
+                    limit=60,
+                    remaining=0,
+                    reset_epoch=1735732800,
+                    retry_after=45,
+                )
+                return statuses.pop(0)
+
+            monkeypatch.setattr(api, "get_status", fake_get_status)
+            await api.wait_for_completion("request-123", poll_interval=1.0)
+
+        assert sleeps == [45.0]
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, monkeypatch, sleeps, make_settings):
+        """Test polling gives up after max_attempts."""
+        async with NapkinAPIClient(make_settings()) as api:
+
+            async def fake_get_status(request_id):
+                return make_status(RequestStatus.PROCESSING)
+
+            monkeypatch.setattr(api, "get_status", fake_get_status)
+            api._status_cache["request-123"] = (
+                '"v1"',
+                None,
+                make_status(RequestStatus.PROCESSING),
+            )
+            with pytest.raises(ProcessingError):
+                await api.wait_for_completion(
+                    "request-123", poll_interval=1.0, max_attempts=3
+                )
+
+            # An abandoned poll must not keep its revalidation entry
+            assert "request-123" not in api._status_cache
+
+        assert len(sleeps) == 3
+
+
+class TestDownloads:
+    """Test streaming file downloads."""
+
+    @pytest.mark.asyncio
+    async def test_save_file_by_url(self, tmp_path, make_settings, mock_transport):
+        """Test the body is written and the filename comes from the headers."""
+        body = b"<svg>" + b"x" * 200_000 + b"</svg>"
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={
+                    "Content-Type": "image/svg+xml",
+                    "Content-Disposition": 'attachment; filename="visual.svg"',
+                },
+                content=body,
+            )
+
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            dest = await api.save_file_by_url("https://files.test/x", tmp_path)
+
+        assert dest == tmp_path / "visual.svg"
+        assert dest.read_bytes() == body
+
+    @pytest.mark.asyncio
+    async def test_stream_file_by_url(
+        self, tmp_path, monkeypatch, make_settings, mock_transport
+    ):
+        """Test the body streams to the exact destination path."""
+        body = b"\x89PNG" + b"\x01" * 50_000
+
+        def handler(request):
+            return httpx.Response(200, content=body)
+
+        monkeypatch.setenv("NAPKIN_DOWNLOAD_CHUNK_SIZE", "4096")
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            dest = await api.stream_file_by_url(
+                "https://files.test/x", tmp_path / "nested" / "out.png"
+            )
+
+        assert dest == tmp_path / "nested" / "out.png"
+        assert dest.read_bytes() == body
+
+    @pytest.mark.asyncio
+    async def test_stream_file_by_url_removes_partial_file(
+        self, tmp_path, make_settings, mock_transport
+    ):
+        """Test a body that fails partway leaves no file behind."""
+
+        async def body():
+            yield b"\x89PNG" + b"\x01" * 10_000
+            raise httpx.ReadError("connection reset")
+
+        def handler(request):
+            return httpx.Response(
+                200, headers={"Content-Length": "100000"}, content=body()
+            )
+
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            with pytest.raises(httpx.ReadError):
+                await api.stream_file_by_url("https://files.test/x", tmp_path / "a.png")
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_download_decodes_content_encoding(
+        self, tmp_path, make_settings, mock_transport
+    ):
+        """Test gzip-encoded bodies are saved decoded."""
+        body = b"<svg>compressible</svg>" * 100
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={"Content-Encoding": "gzip"},
+                content=gzip.compress(body),
+            )
+
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            path = await api.download_file(
+                "request-123", "file-1234", save_path=tmp_path / "out.svg"
+            )
+
+        assert path.read_bytes() == body
+
+    @pytest.mark.asyncio
+    async def test_iter_file(self, monkeypatch, make_settings, mock_transport):
+        """Test the body streams in chunks and error statuses raise."""
+        body = b"x" * 100_000
+
+        def handler(request):
+            if request.url.path == "/missing":
+                return httpx.Response(404, json={"error": "not found"})
+            return httpx.Response(200, content=body)
+
+        monkeypatch.setenv("NAPKIN_DOWNLOAD_CHUNK_SIZE", "4096")
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            async with api.iter_file("https://files.test/x") as stream:
+                chunks = [chunk async for chunk in stream]
+            with pytest.raises(NapkinAPIError, match="not found"):
+                async with api.iter_file("https://files.test/missing"):
+                    pass
+
+        assert b"".join(chunks) == body
+        assert max(len(chunk) for chunk in chunks) <= 4096
+
+    @pytest.mark.asyncio
+    async def test_download_file_by_url_with_hasher(
+        self, make_settings, mock_transport
+    ):
+        """Test bytes are returned and hashed in a single pass."""
+        body = b"\x89PNG" + b"\x00" * 70_000
+
+        def handler(request):
+            return httpx.Response(200, content=body)
+
+        hasher = hashlib.sha256()
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            data = await api.download_file_by_url("https://files.test/x", hasher)
+
+        assert data == body
+        assert hasher.hexdigest() == hashlib.sha256(body).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_download_all(self, tmp_path, make_settings, mock_transport):
+        """Test files download concurrently, retrying rate-limited ones."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.path)
+            if (
+                request.url.path.endswith("file-0002")
+                and seen.count(request.url.path) == 1
+            ):
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(
+                200,
+                headers={"Content-Type": "image/png"},
+                content=request.url.path.encode(),
+            )
+
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            paths = await api.download_all(
+                "request-123",
+                [("file-0001", "https://files.test/a.png"), ("file-0002", None)],
+                tmp_path,
+            )
+
+        assert paths == [
+            tmp_path / "request-123_file-0001.png",
+            tmp_path / "request-123_file-0002.png",
+        ]
+        assert paths[1].read_bytes() == b"/v1/visual/request-123/file/file-0002"
+        assert seen.count("/v1/visual/request-123/file/file-0002") == 2
+
+    @pytest.mark.asyncio
+    async def test_download_all_cancels_on_failure(
+        self, tmp_path, make_settings, mock_transport
+    ):
+        """Test a failed download cancels its siblings before raising."""
+        cancelled = []
+
+        async def handler(request):
+            if request.url.path.endswith("missing"):
+                return httpx.Response(404, json={"error": "not found"})
+            try:
+                await asyncio.Event().wait()
+            finally:
+                cancelled.append(request.url.path)
+
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            with pytest.raises(NapkinAPIError, match="not found"):
+                await api.download_all(
+                    "request-123",
+                    [
+                        ("file-0001", "https://files.test/slow"),
+                        ("file-0002", "https://files.test/missing"),
+                    ],
+                    tmp_path,
+                )
+
+        assert cancelled == ["/slow"]
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestContentDisposition:
+    """Test filename inference from Content-Disposition."""
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ('attachment; filename="visual.svg"', "visual.svg"),
+            ("inline; filename=visual.png", "visual.png"),
+            (
+                "attachment; filename=\"plain.svg\"; filename*=UTF-8''na%C3%AFve.svg",
+                "naïve.svg",
+            ),
+            ("attachment; filename*=ISO-8859-1''caf%E9.png", "café.png"),
+            ('attachment; filename="a;b \\"c\\".svg"', 'a;b "c".svg'),
+            ("attachment", None),
+            ("", None),
+        ],
+    )
+    def test_infer_filename(self, header, expected, api):
+        """Test filename* takes precedence and is percent-decoded."""
+        assert api._infer_filename_from_content_disposition(header) == expected
+
+
+class TestRequests:
+    """Test request/response handling against a mock transport."""
+
+    @pytest.mark.asyncio
+    async def test_create_visual_and_status(self, make_settings, mock_transport):
+        """Test the request body is JSON and responses are parsed."""
+        bodies = []
+
+        def handler(request):
+            if request.method == "POST":
+                bodies.append(json.loads(request.content))
+                return httpx.Response(
+                    201,
+                    json={
+                        "id": "request-123",
+                        "status": "pending",
+                        "created_at": "2025-01-01T12:00:00Z",
+                    },
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "status": "completed",
+                    "generated_files": [{"id": "file-1", "url": "https://f/1"}],
+                },
+            )
+
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler, headers=api.headers)
+            created = await api.create_visual(
+                VisualRequest(content="Test content", format=OutputFormat.PNG)
+            )
+            status = await api.get_status(created.request_id)
+
+        assert bodies[0]["content"] == "Test content"
+        assert bodies[0]["format"] == "png"
+        assert "api_token" not in bodies[0]
+        assert created.request_id == "request-123"
+        assert created.created_at.tzinfo is not None
+        assert status.status == RequestStatus.COMPLETED
+        assert status.files == [{"id": "file-1", "url": "https://f/1"}]
+
+    @pytest.mark.asyncio
+    async def test_status_conditional_get(self, make_settings, mock_transport):
+        """Test unchanged statuses are revalidated with If-None-Match."""
+        sent = []
+
+        def handler(request):
+            sent.append(request.headers.get("If-None-Match"))
+            if len(sent) == 1:
+                return httpx.Response(
+                    200,
+                    headers={"ETag": '"v1"'},
+                    json={"status": "processing", "progress": 40},
+                )
+            if len(sent) == 2:
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(
+                200, headers={"ETag": '"v2"'}, json={"status": "completed"}
+            )
+
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            first = await api.get_status("request-123")
+            second = await api.get_status("request-123")
+            third = await api.get_status("request-123")
+
+            assert "request-123" not in api._status_cache
+
+        assert sent == [None, '"v1"', '"v1"']
+        assert second == first
+        assert second.progress == 40
+        assert third.status == RequestStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_status_cache_is_bounded(
+        self, monkeypatch, make_settings, mock_transport
+    ):
+        """Test the least recently polled request is evicted first."""
+
+        def handler(request):
+            return httpx.Response(
+                200, headers={"ETag": '"v1"'}, json={"status": "processing"}
+            )
+
+        monkeypatch.setattr(client_module, "_STATUS_CACHE_SIZE", 2)
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            for request_id in ["request-1", "request-2", "request-1", "request-3"]:
+                await api.get_status(request_id)
+
+            assert list(api._status_cache) == ["request-1", "request-3"]
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_are_retried(
+        self, monkeypatch, make_settings, mock_transport
+    ):
+        """Test transient connection errors are retried with backoff."""
+        calls = []
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200, json={"status": "processing"})
+
+        monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            status = await api.get_status("request-123")
+
+        assert status.status == RequestStatus.PROCESSING
+        assert len(calls) == 3
+        assert 2 <= sleeps[0] < 3 and 4 <= sleeps[1] < 5
+
+    @pytest.mark.asyncio
+    async def test_transport_error_without_retries(self, make_settings, mock_transport):
+        """Test the original error surfaces once retries are exhausted."""
+
+        def handler(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        settings = make_settings(NAPKIN_MAX_RETRIES="0")
+        async with NapkinAPIClient(settings) as api:
+            await mock_transport(api, handler)
+            with pytest.raises(httpx.ConnectError):
+                await api.get_status("request-123")
+
+    @pytest.mark.asyncio
+    async def test_error_response(self, make_settings, mock_transport):
+        """Test API errors map to exception types."""
+
+        def handler(request):
+            return httpx.Response(400, json={"error": "bad input", "code": "E1"})
+
+        async with NapkinAPIClient(make_settings()) as api:
+            await mock_transport(api, handler)
+            with pytest.raises(RequestError) as exc_info:
+                await api.get_status("request-123")
+
+        assert str(exc_info.value) == "bad input"
+        assert exc_info.value.code == "E1"
+
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            (httpx.Response(502), "HTTP 502 error"),
+            (httpx.Response(500, text="upstream timeout"), "upstream timeout"),
+            (
+                httpx.Response(
+                    500, headers={"Content-Type": "application/json"}, content=b"{"
+                ),
+                "{",
+            ),
+        ],
+    )
+    def test_non_json_error_response(self, response, expected, api):
+        """Test empty and non-JSON error bodies fall back to the text."""
+        with pytest.raises(NapkinAPIError) as exc_info:
+            api._handle_error_response(response)
+
+        assert str(exc_info.value) == expected
+        assert exc_info.value.code is None
+
+
+class TestSharedClient:
+    """Test HTTP client sharing between instances."""
+
+    @pytest.mark.asyncio
+    async def test_instances_share_client(self, make_settings):
+        """Test shared clients survive instance close until aclose_shared."""
+        settings = make_settings(NAPKIN_SHARE_CLIENT="true")
+        async with NapkinAPIClient(settings) as first:
+            shared = first.client
+        async with NapkinAPIClient(settings) as second:
+            assert second.client is shared
+        assert not shared.is_closed
+
+        await NapkinAPIClient.aclose_shared()
+        assert shared.is_closed
+        async with NapkinAPIClient(make_settings()) as own:
+            assert own.client is not shared
+
+    def test_clients_are_per_loop(self, make_settings):
+        """Test each event loop gets its own shared client."""
+        settings = make_settings(NAPKIN_SHARE_CLIENT="true")
+
+        async def get_client():
+            return NapkinAPIClient.shared_client(settings)
+
+        loops = [asyncio.new_event_loop() for _ in range(2)]
+        try:
+            first, second = (loop.run_until_complete(get_client()) for loop in loops)
+            assert loops[0].run_until_complete(get_client()) is first
+            assert second is not first
+
+            loops[0].run_until_complete(NapkinAPIClient.aclose_shared())
+            assert first.is_closed
+            assert not second.is_closed
+        finally:
+            for loop in loops:
+                loop.run_until_complete(NapkinAPIClient.aclose_shared())
+                loop.close()
+
+
+class TestRateLimitHeaders:
+    """Test rate limit header parsing."""
+
+    def test_no_headers(self, api):
+        """Test responses without rate limit headers yield no info."""
+        assert api._extract_rate_limit_info(httpx.Response(200)) is None
+
+    def test_full_headers(self, api):
+        """Test limit, remaining and reset are parsed as UTC."""
+        info = api._extract_rate_limit_info(
+            httpx.Response(
+                200,
+                headers={
+                    "X-RateLimit-Limit": "60",
+                    "X-RateLimit-Remaining": "12",
+                    "X-RateLimit-Reset": "1735732800",
+                },
+            )
+        )
+        assert info is not None
+        assert (info.limit, info.remaining, info.retry_after) == (60, 12, None)
+        assert info.reset == datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    def test_retry_after_only(self, api):
+        """Test Retry-After alone still produces a reset time."""
+        info = api._extract_rate_limit_info(
+            httpx.Response(429, headers={"Retry-After": "30"})
+        )
+        assert info is not None
+        assert info.retry_after == 30
+        assert info.is_exceeded
+        assert info.reset > datetime.now(timezone.utc)
+
+    @pytest.mark.parametrize(
+        "headers, expected_retry_after",
+        [
+            ({"X-RateLimit-Limit": "60", "X-RateLimit-Reset": "9" * 20}, None),
+            ({"X-RateLimit-Reset": "9" * 20, "Retry-After": "30"}, 30),
+            ({"Retry-After": "9" * 20}, int("9" * 20)),
+        ],
+    )
+    def test_out_of_range_reset(self, api, headers, expected_retry_after):
+        """Test absurd reset values never make the reset time unrepresentable."""
+        info = api._extract_rate_limit_info(httpx.Response(429, headers=headers))
+
+        if expected_retry_after is None:
+            assert info is None
+        else:
+            assert info is not None
+            assert info.retry_after == expected_retry_after
+            assert info.reset > datetime.now(timezone.utc)
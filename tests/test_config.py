@@ -43,6 +43,24 @@ class TestSettings:
             assert settings.max_retries == 3
             assert settings.timeout_seconds == 30
 
+    def test_connection_pool_settings(self):
+        """Test connection pool defaults and overrides."""
+        with patch.dict(os.environ, {"NAPKIN_API_TOKEN": "test-token"}):
+            settings = Settings()
+            assert settings.max_connections == 100
+            assert settings.max_keepalive_connections == 50
+            assert settings.keepalive_expiry_seconds == 30.0
+
+        with patch.dict(
+            os.environ,
+            {
+                "NAPKIN_API_TOKEN": "test-token",
+                "NAPKIN_MAX_CONNECTIONS": "0",
+            },
+        ):
+            with pytest.raises(ValidationError):
+                Settings()
+
     def test_format_validation(self):
         """Test format validation."""
         with patch.dict(
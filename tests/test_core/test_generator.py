@@ -0,0 +1,207 @@
+"""
+Tests for the visual generator.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.client import NapkinAPIError
+from src.api.models import RequestStatus, StatusResponse
+from src.core.generator import VisualGenerator
+from src.utils.constants import STYLES
+
+
+class FakeClient:
+    """Stand-in for NapkinAPIClient that serves canned files."""
+
+    def __init__(self, files=None, files_ready=0, failing_urls=()):
+        self.files = files
+        self.files_ready = files_ready
+        self.failing_urls = set(failing_urls)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.created = []
+
+    async def create_visual(self, request):
+        if request.content == "bad":
+            raise NapkinAPIError("rejected")
+        self.created.append(request.content)
+        return SimpleNamespace(request_id="request-123")
+
+    async def wait_for_completion(self, request_id):
+        await self._track()
+        return StatusResponse(
+            request_id=request_id,
+            status=RequestStatus.COMPLETED,
+            files_ready=self.files_ready,
+            files=self.files,
+        )
+
+    async def _track(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+    async def stream_file_by_url(self, url, dest):
+        await self._track()
+        if url in self.failing_urls:
+            raise NapkinAPIError(f"cannot fetch {url}")
+        dest.write_bytes(url.encode())
+        return dest
+
+    async def download_file(self, request_id, file_id, save_path):
+        await self._track()
+        save_path.write_bytes(file_id.encode())
+        return save_path
+
+
+class TestPrepareRequest:
+    """Test request preparation."""
+
+    @pytest.mark.parametrize(
+        "style, expected",
+        [
+            ("vibrant-strokes", STYLES["vibrant-strokes"].id),
+            (" Vibrant Strokes ", STYLES["vibrant-strokes"].id),
+            ("custom-style-id", "custom-style-id"),
+            (None, STYLES["sketch-notes"].id),
+        ],
+    )
+    def test_style_resolution(self, style, expected, make_settings):
+        """Test style names, slugs and custom IDs resolve to API IDs."""
+        generator = VisualGenerator(make_settings(NAPKIN_DEFAULT_STYLE="sketch-notes"))
+
+        request = generator._prepare_request("content", style=style)
+
+        assert request.style_id == expected
+
+
+class TestGenerate:
+    """Test single-content generation."""
+
+    @pytest.mark.asyncio
+    async def test_downloads_run_concurrently(self, tmp_path, make_settings):
+        """Test all files are fetched together and failures are skipped."""
+        files = [
+            {"id": "file-1", "url": "https://cdn.example/a.svg", "filename": "a.svg"},
+            {"id": "file-2", "url": "https://cdn.example/b.svg", "filename": "b.svg"},
+            {"id": "file-3", "url": "https://cdn.example/c.svg", "filename": "c.svg"},
+        ]
+        generator = VisualGenerator(make_settings())
+        generator.client = FakeClient(
+            files=files,
+            files_ready=3,
+            failing_urls={"https://cdn.example/b.svg"},
+        )
+
+        _, paths = await generator.generate("content", output_dir=tmp_path)
+
+        assert generator.client.max_in_flight == 3
+        assert paths == [tmp_path / "a.svg", tmp_path / "c.svg"]
+        assert paths[0].read_bytes() == b"https://cdn.example/a.svg"
+
+    @pytest.mark.asyncio
+    async def test_extension_from_url_path(self, tmp_path, make_settings):
+        """Test the saved file takes its extension from the URL path."""
+        files = [
+            {"id": "file-1", "url": "https://cdn.example/v.PNG?sig=a.svg"},
+            {"id": "file-2", "url": "https://cdn.example/download?id=1"},
+        ]
+        generator = VisualGenerator(make_settings())
+        generator.client = FakeClient(files=files, files_ready=2)
+
+        _, paths = await generator.generate(
+            "content", output_dir=tmp_path, format="svg"
+        )
+
+        assert [p.suffix for p in paths] == [".png", ".svg"]
+
+    @pytest.mark.asyncio
+    async def test_shared_filename_gets_unique_paths(self, tmp_path, make_settings):
+        """Test files with the same provided filename do not overwrite each other."""
+        files = [
+            {"id": "file-1", "url": "https://cdn.example/1", "filename": "v.svg"},
+            {"id": "file-2", "url": "https://cdn.example/2", "filename": "v.svg"},
+        ]
+        generator = VisualGenerator(make_settings())
+        generator.client = FakeClient(files=files, files_ready=2)
+
+        _, paths = await generator.generate("content", output_dir=tmp_path)
+
+        assert paths == [tmp_path / "v.svg", tmp_path / "v_2.svg"]
+        assert [p.read_bytes() for p in paths] == [
+            b"https://cdn.example/1",
+            b"https://cdn.example/2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sequential_id_fallback(self, tmp_path, make_settings):
+        """Test file IDs are guessed when the status lists no files."""
+        generator = VisualGenerator(make_settings())
+        generator.client = FakeClient(files_ready=2)
+
+        _, paths = await generator.generate(
+            "content", output_dir=tmp_path, format="png"
+        )
+
+        assert [p.read_bytes() for p in paths] == [b"file_1", b"file_2"]
+        assert all(p.suffix == ".png" for p in paths)
+
+
+class TestGenerateBatch:
+    """Test batch generation."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self, tmp_path, make_settings):
+        """Test the worker pool bounds concurrency and keeps input order."""
+        generator = VisualGenerator(make_settings())
+        generator.client = FakeClient()
+        contents = ["one", "bad", "three", "four", "five"]
+
+        results = await generator.generate_batch(contents, concurrent_limit=2)
+
+        assert generator.client.max_in_flight == 2
+        assert [content for content, _, _ in results] == contents
+        assert [status is not None for _, status, _ in results] == [
+            True,
+            False,
+            True,
+            True,
+            True,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_iter_batch_streams_results(self, make_settings):
+        """Test iter_batch yields every item with its index."""
+        generator = VisualGenerator(make_settings())
+        generator.client = FakeClient()
+
+        seen = [
+            index
+            async for index, _, _, _ in generator.iter_batch(
+                ["a", "b", "c"], concurrent_limit=3
+            )
+        ]
+
+        assert sorted(seen) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_contents_generate_once(self, tmp_path, make_settings):
+        """Test repeated contents reuse the first item's files."""
+        files = [{"id": "file-1", "url": "https://cdn.example/a.svg"}]
+        generator = VisualGenerator(make_settings())
+        generator.client = FakeClient(files=files, files_ready=1)
+
+        results = await generator.generate_batch(
+            ["same", "other", "same"], output_dir=tmp_path, concurrent_limit=3
+        )
+
+        assert sorted(generator.client.created) == ["other", "same"]
+        first_paths, copied_paths = results[0][2], results[2][2]
+        assert results[2][1] is not None
+        assert copied_paths[0].parent == tmp_path / "batch_003"
+        assert copied_paths[0].name == first_paths[0].name
+        assert copied_paths[0].read_bytes() == first_paths[0].read_bytes()
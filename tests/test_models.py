@@ -6,12 +6,14 @@ import pytest
 from pydantic import ValidationError
 
 from src.api.models import (
+    GENERATED_FILE_LIST_ADAPTER,
     VisualRequest,
     RequestStatus,
     OutputFormat,
     VisualResponse,
     StatusResponse,
     RateLimitInfo,
+    MAX_RESET_EPOCH,
 )
 
 
@@ -89,6 +91,35 @@ class TestVisualRequest:
         with pytest.raises(ValidationError):
             VisualRequest(content="Test", number_of_visuals=5)
 
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            ("number_of_visuals", True),
+            ("number_of_visuals", "2"),
+            ("width", "800"),
+            ("height", 800.0),
+        ],
+    )
+    def test_integer_options_are_strict(self, field, value):
+        """Test bools, strings and floats are not coerced into int options."""
+        with pytest.raises(ValidationError):
+            VisualRequest(content="Test", format=OutputFormat.PNG, **{field: value})
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            ("content", b"Test"),
+            ("language", b"en-US"),
+            ("style_id", 12345678),
+            ("context_before", b"Intro"),
+        ],
+    )
+    def test_string_options_are_strict(self, field, value):
+        """Test bytes and numbers are not coerced into string options."""
+        kwargs = {"content": "Test", field: value}
+        with pytest.raises(ValidationError):
+            VisualRequest(**kwargs)
+
 
 class TestVisualResponse:
     """Test VisualResponse model."""
@@ -128,18 +159,36 @@ class TestVisualResponse:
         assert response.is_terminal is False
 
 
+class TestGeneratedFile:
+    """Test GeneratedFile list parsing."""
+
+    def test_list_adapter(self):
+        """Test the shared adapter validates raw file lists."""
+        files = GENERATED_FILE_LIST_ADAPTER.validate_python(
+            [
+                {"id": "FILE_abc123", "format": "svg"},
+                {"id": "FILE_def456", "format": "png", "width": 1024},
+            ]
+        )
+        assert [f.format for f in files] == [OutputFormat.SVG, OutputFormat.PNG]
+        assert files[1].width == 1024
+
+        with pytest.raises(ValidationError):
+            GENERATED_FILE_LIST_ADAPTER.validate_python([{"id": "short"}])
+
+
 class TestRateLimitInfo:
     """Test RateLimitInfo model."""
 
     def test_is_exceeded_property(self):
         """Test rate limit exceeded checking."""
-        from datetime import datetime, timedelta, timezone
+        import time
 
         # Not exceeded
         info = RateLimitInfo(
             limit=60,
             remaining=30,
-            reset=datetime.now(timezone.utc) + timedelta(minutes=5),
+            reset_epoch=int(time.time()) + 300,
         )
         assert info.is_exceeded is False
 
@@ -147,11 +196,19 @@ class TestRateLimitInfo:
         info = RateLimitInfo(
             limit=60,
             remaining=0,
-            reset=datetime.now(timezone.utc) + timedelta(minutes=5),
+            reset_epoch=int(time.time()) + 300,
             retry_after=300,
         )
         assert info.is_exceeded is True
 
+    def test_reset_epoch_is_bounded(self):
+        """Test reset times datetime cannot represent are rejected."""
+        info = RateLimitInfo(limit=60, remaining=0, reset_epoch=MAX_RESET_EPOCH)
+        assert info.reset.year == 9999
+
+        with pytest.raises(ValidationError):
+            RateLimitInfo(limit=60, remaining=0, reset_epoch=MAX_RESET_EPOCH + 1)
+
 
 class TestStatusResponse:
     """Test StatusResponse model."""
@@ -196,3 +253,14 @@ class TestStatusResponse:
                 status=RequestStatus.PROCESSING,
                 progress=-1.0,
             )
+
+    def test_from_json_bytes(self):
+        """Test parsing a raw JSON body."""
+        status = StatusResponse.from_json_bytes(
+            b'{"request_id": "test-123", "status": "processing", "progress": 42.5}'
+        )
+        assert status.status == RequestStatus.PROCESSING
+        assert status.progress == 42.5
+
+        with pytest.raises(ValidationError):
+            StatusResponse.from_json_bytes(b'{"request_id": "test-123"}')
@@ -0,0 +1,236 @@
+"""
+Tests for the GitHub Actions monitor script.
+"""
+
+import importlib.util
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+# scripts/ is not a package, so load the script straight from its file
+_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "gh_monitor.py"
+_spec = importlib.util.spec_from_file_location("gh_monitor", _SCRIPT)
+gh_monitor = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gh_monitor)
+
+RUNS_URL = (
+    "https://api.github.com/repos/owner/repo/actions/runs"
+    "?status=completed&exclude_pull_requests=true&per_page=50"
+)
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in."""
+
+    def __init__(self, status_code=200, content=b"", headers=None, json_data=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self._json = json_data
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_lines(self):
+        return iter(self.content.splitlines())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """requests.Session stand-in that replays queued responses."""
+
+    def __init__(self):
+        self.responses = []
+        self.calls = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.calls.append(("GET", url, headers))
+        return self.responses.pop(0)
+
+    def post(self, url, data=None, headers=None, **kwargs):
+        self.calls.append(("POST", url, headers))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def session():
+    """Stubbed HTTP session."""
+    return FakeSession()
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch, session):
+    """GitHubMonitor for owner/repo with an isolated cache and stubbed session."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(gh_monitor, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+    monkeypatch.setenv("GITHUB_TOKEN", "env-token")
+    monkeypatch.delenv("GH_MONITOR_TTL", raising=False)
+    instance = gh_monitor.GitHubMonitor()
+    instance._session = session
+    return instance
+
+
+class TestConditionalCache:
+    """Test ETag caching of API responses."""
+
+    def test_304_reuses_cached_body(self, monitor, session):
+        """Test a 304 reply is answered from the cache written by the 200."""
+        session.responses = [
+            FakeResponse(200, b'{"total_count": 1}', {"ETag": '"v1"'}),
+            FakeResponse(304),
+        ]
+
+        assert monitor._fetch_url(RUNS_URL, cache=True) == {"total_count": 1}
+        assert monitor._fetch_url(RUNS_URL, cache=True) == {"total_count": 1}
+
+        first_headers, second_headers = (headers for _, _, headers in session.calls)
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == '"v1"'
+
+    def test_cache_write_is_atomic(self, monitor):
+        """Test the cache stores the ETag line and body without a temp file."""
+        monitor._write_cache(RUNS_URL, '"v1"', b"{}")
+
+        path = monitor._cache_path(RUNS_URL)
+        assert path.read_bytes() == b'"v1"\n{}'
+        assert list(path.parent.iterdir()) == [path]
+        assert monitor._read_cache(RUNS_URL) == ('"v1"', b"{}")
+
+    def test_runs_ttl_expiry(self, monitor, session):
+        """Test runs are served from cache within the TTL, then revalidated."""
+        session.responses = [
+            FakeResponse(200, b'{"workflow_runs": []}', {"ETag": '"v1"'}),
+            FakeResponse(304),
+        ]
+        assert monitor.fetch_runs() == {"workflow_runs": []}
+
+        monitor.clear_cache()
+        assert monitor.fetch_runs() == {"workflow_runs": []}
+        assert len(session.calls) == 1  # Fresh entry: no request at all
+
+        # Age the entry past the TTL
+        stale = time.time() - gh_monitor.DEFAULT_RUNS_TTL - 1
+        os.utime(monitor._cache_path(RUNS_URL), (stale, stale))
+        monitor.clear_cache()
+        assert monitor.fetch_runs() == {"workflow_runs": []}
+        assert len(session.calls) == 2
+        assert session.calls[1][2]["If-None-Match"] == '"v1"'
+        assert monitor._cache_age(RUNS_URL) < gh_monitor.DEFAULT_RUNS_TTL
+
+
+class TestFetchJobs:
+    """Test the GraphQL jobs lookup."""
+
+    def test_maps_graphql_fields_to_rest_shape(self, monitor, session):
+        """Test check runs become REST-style jobs keyed by run ID."""
+        session.responses = [
+            FakeResponse(
+                json_data={
+                    "data": {
+                        "nodes": [
+                            {
+                                "databaseId": 11,
+                                "checkSuite": {
+                                    "checkRuns": {
+                                        "nodes": [
+                                            {
+                                                "databaseId": 101,
+                                                "name": "test",
+                                                "conclusion": "FAILURE",
+                                                "steps": {
+                                                    "nodes": [
+                                                        {
+                                                            "name": "pytest",
+                                                            "conclusion": "FAILURE",
+                                                        },
+                                                        {
+                                                            "name": "cleanup",
+                                                            "conclusion": None,
+                                                        },
+                                                    ]
+                                                },
+                                            }
+                                        ]
+                                    }
+                                },
+                            },
+                            None,
+                            {"databaseId": 12, "checkSuite": None},
+                        ]
+                    }
+                }
+            )
+        ]
+
+        jobs = monitor.fetch_jobs([{"node_id": "R1"}, {"node_id": "R2"}, {}])
+
+        assert jobs == {
+            11: {
+                "jobs": [
+                    {
+                        "id": 101,
+                        "name": "test",
+                        "conclusion": "failure",
+                        "steps": [
+                            {"name": "pytest", "conclusion": "failure"},
+                            {"name": "cleanup", "conclusion": None},
+                        ],
+                    }
+                ]
+            }
+        }
+        ((method, url, _),) = session.calls
+        assert (method, url) == ("POST", gh_monitor.GRAPHQL_URL)
+
+    def test_graphql_errors_yield_no_jobs(self, monitor, session):
+        """Test a GraphQL error leaves every run to the REST fallback."""
+        session.responses = [FakeResponse(json_data={"errors": [{"message": "x"}]})]
+
+        assert monitor.fetch_jobs([{"node_id": "R1"}]) == {}
+
+
+class TestLogsAndConfig:
+    """Test log scanning and repository/token discovery."""
+
+    def test_scan_log_stops_at_limit(self, monitor, session):
+        """Test only the first error lines are returned."""
+        log = b"ok\nError: one\nfine\nFAILED two\nerror three\n"
+        session.responses = [FakeResponse(200, log)]
+
+        assert monitor._scan_log("https://example/logs", limit=2) == [
+            "Error: one",
+            "FAILED two",
+        ]
+
+    @pytest.mark.parametrize(
+        "line",
+        ['GITHUB_TOKEN="abc"', "  GITHUB_API_TOKEN = 'abc'", "GITHUB_TOKEN=abc"],
+    )
+    def test_token_from_env_file(self, monitor, line):
+        """Test both token keys are read from .env, quotes stripped."""
+        Path(".env").write_text(f"OTHER=1\n{line}\n")
+
+        assert monitor._load_token() == "abc"
+
+    def test_unparsable_git_config_falls_back_to_git(self, monitor, monkeypatch):
+        """Test a .git/config configparser rejects defers to the git command."""
+        monkeypatch.delenv("GITHUB_REPOSITORY")
+        Path(".git").mkdir()
+        Path(".git/config").write_text("[core]\n\tbare\n")
+        monkeypatch.setattr(
+            monitor, "_git_origin_url", lambda: "git@github.com:owner/other.git"
+        )
+
+        assert monitor._get_repo() == "owner/other"